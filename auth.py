@@ -9,13 +9,15 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Global variable to store valid API keys
-VALID_API_KEYS = []
+# A frozenset gives O(1) membership checks on every request instead of
+# scanning a list
+VALID_API_KEYS = frozenset()
 
 
 def init_auth(api_keys):
     """Initialize authentication with API keys"""
     global VALID_API_KEYS
-    VALID_API_KEYS = api_keys
+    VALID_API_KEYS = frozenset(api_keys)
     logger.info(f"Authentication initialized with {len(api_keys)} API key(s)")
 
 
@@ -27,6 +29,7 @@ def require_api_key(f):
         api_key = request.headers.get('X-API-Key')
         
         if not api_key:
+            # %-style args defer formatting until the record is emitted
             logger.warning("Request without API key")
             return jsonify({
                 'success': False,
@@ -34,7 +37,8 @@ def require_api_key(f):
             }), 401
         
         if api_key not in VALID_API_KEYS:
-            logger.warning(f"Invalid API key attempted: {api_key[:10]}...")
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Invalid API key attempted: %s...", api_key[:10])
             return jsonify({
                 'success': False,
                 'error': 'Invalid API key'
@@ -57,17 +57,32 @@ def create_printer_icon(size=256):
     
     return img
 
-def save_windows_icon(img, filepath):
+def build_pyramid(img, sizes):
+    """Build a dict of size -> resized image
+    
+    Each downscale level resamples from the previous (larger) level
+    instead of always from the full-size source, so the expensive
+    LANCZOS filtering shrinks along with the image. Upscale targets
+    come straight from the source.
+    """
+    pyramid = {}
+    prev = img
+    for size in sorted(set(sizes), reverse=True):
+        source = img if size >= prev.width else prev
+        pyramid[size] = source.resize((size, size), Image.Resampling.LANCZOS)
+        if size <= img.width:
+            prev = pyramid[size]
+    return pyramid
+
+def save_windows_icon(pyramid, filepath):
     """Save as Windows .ico file"""
     sizes = [(16, 16), (32, 32), (48, 48), (256, 256)]
-    icons = []
-    for size in sizes:
-        icons.append(img.resize(size, Image.Resampling.LANCZOS))
+    icons = [pyramid[s[0]] for s in sizes]
     
     icons[0].save(filepath, format='ICO', sizes=[(s[0], s[1]) for s in sizes])
     print(f"Created Windows icon: {filepath}")
 
-def save_macos_icon(img, iconset_path):
+def save_macos_icon(pyramid, iconset_path):
     """Save as macOS .icns file"""
     sizes = [
         (16, 'icon_16x16.png'),
@@ -87,8 +102,7 @@ def save_macos_icon(img, iconset_path):
     
     # Generate all required sizes
     for size, filename in sizes:
-        resized = img.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(os.path.join(iconset_path, filename))
+        pyramid[size].save(os.path.join(iconset_path, filename))
     
     print(f"Created macOS iconset: {iconset_path}")
     print("To convert to .icns, run:")
@@ -103,13 +117,16 @@ if __name__ == '__main__':
     print("Generating print server icon...")
     icon = create_printer_icon(256)
     
+    # Build all target sizes once, shared by both platforms
+    pyramid = build_pyramid(icon, [16, 32, 48, 64, 128, 256, 512, 1024])
+    
     # Save Windows icon
     ico_path = os.path.join(static_dir, 'icon.ico')
-    save_windows_icon(icon, ico_path)
+    save_windows_icon(pyramid, ico_path)
     
     # Save macOS iconset
     iconset_path = os.path.join(static_dir, 'icon.iconset')
-    save_macos_icon(icon, iconset_path)
+    save_macos_icon(pyramid, iconset_path)
     
     # Also save a PNG for reference
     png_path = os.path.join(static_dir, 'icon.png')
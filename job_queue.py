@@ -6,14 +6,95 @@ import sqlite3
 import logging
 import threading
 import time
-import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Optional
 import json
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from printer_manager import PrinterManager
+
 logger = logging.getLogger(__name__)
 
+# Lightweight row type for job queries: one shared class instead of a
+# fresh dict (and its per-key allocations) per returned row; callers
+# that need a dict (e.g. for JSON) use Job._asdict() at the edge
+Job = namedtuple('Job', [
+    'job_id', 'printer_name', 'document_name', 'document', 'copies',
+    'options', 'status', 'error_message', 'retry_count', 'created_at',
+    'updated_at', 'completed_at', 'compressed'
+])
+
+# Stored documents larger than this get zstd-compressed; print payloads
+# (PDF/base64/ESC-POS) typically shrink 2-10x, cutting WAL write volume
+_COMPRESS_THRESHOLD = 4096
+_COMPRESS_MAGIC = b'ZSTD'
+
+# UPDATE ... RETURNING needs SQLite >= 3.35; Ubuntu 20.04 / Debian 11
+# (both supported by install_linux.sh) ship 3.31 / 3.34
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+# Hot-path SQL as module-level constants: sqlite3 caches prepared
+# statements per connection keyed on the statement text, so reusing the
+# same string objects skips re-parsing the SQL on every call
+# Current jobs-table schema; also used verbatim when rebuilding a
+# pre-1.4 table during migration
+_SQL_CREATE_JOBS = '''
+    CREATE TABLE IF NOT EXISTS print_jobs (
+        job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        printer_name TEXT NOT NULL,
+        document_name TEXT NOT NULL,
+        document BLOB NOT NULL,
+        copies INTEGER DEFAULT 1,
+        options TEXT,
+        status TEXT DEFAULT 'pending',
+        error_message TEXT,
+        retry_count INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMP,
+        created_at_epoch INTEGER DEFAULT (strftime('%s', 'now')),
+        compressed INTEGER DEFAULT 0
+    )
+'''
+
+_SQL_INSERT_JOB = '''
+    INSERT INTO print_jobs (printer_name, document_name, document, 
+                           copies, options, compressed, status, created_at_epoch)
+    VALUES (?, ?, ?, ?, ?, ?, 'pending', strftime('%s', 'now'))
+'''
+
+_SQL_UPDATE_STATUS = '''
+    UPDATE print_jobs
+    SET status = ?, updated_at = CURRENT_TIMESTAMP, error_message = ?
+    WHERE job_id = ?
+'''
+
+_SQL_UPDATE_STATUS_COMPLETED = '''
+    UPDATE print_jobs
+    SET status = ?, updated_at = CURRENT_TIMESTAMP,
+        completed_at = CURRENT_TIMESTAMP, error_message = ?
+    WHERE job_id = ?
+'''
+
+_SQL_INC_RETRY = '''
+    UPDATE print_jobs
+    SET retry_count = retry_count + 1, updated_at = CURRENT_TIMESTAMP
+    WHERE job_id = ?
+'''
+
+_SQL_CANCEL = '''
+    UPDATE print_jobs
+    SET status = 'cancelled', updated_at = CURRENT_TIMESTAMP
+    WHERE job_id = ? AND status IN ('pending', 'failed')
+'''
+
 
 class JobQueue:
     """Manages print job queue with retry logic"""
@@ -25,245 +106,521 @@ class JobQueue:
         self.start_time = datetime.now()
         self.running = False
         self.worker_thread = None
+        self._cleanup_timer = None
+        self.printer_manager = None
+        
+        # Per-thread cached connections (see _conn); tracked so stop()
+        # can close them all
+        self._local = threading.local()
+        self._all_conns = []
+        self._conns_lock = threading.Lock()
+        
+        # Worker wake-up signal: submit_job notifies so new jobs start
+        # immediately instead of waiting out the poll interval
+        self._wake = threading.Condition()
+        
+        # Optional zstd document compression (graceful no-op when the
+        # zstandard package isn't installed)
+        if zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=3)
+            self._decompressor = zstandard.ZstdDecompressor()
+        else:
+            self._compressor = None
+            self._decompressor = None
         
         # Initialize database
         self._init_db()
     
+    def _connect(self):
+        """Open a database connection with tuned pragmas applied
+        (busy_timeout and synchronous are per-connection, not persistent)"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA busy_timeout=30000')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')  # 20MB page cache
+        return conn
+
+    def _conn(self):
+        """Get the calling thread's cached connection, creating it on
+        first use. Reusing connections keeps the page cache warm and
+        avoids re-parsing the schema on every call."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA busy_timeout=30000')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA cache_size=-20000')
+            self._local.conn = conn
+            with self._conns_lock:
+                self._all_conns.append(conn)
+        return conn
+
     def _init_db(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
+
+        # Incremental autovacuum lets cleanup_old_jobs reclaim deleted
+        # pages; only takes effect on a freshly created database
+        conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+
+        # WAL avoids an fsync per single-row write and lets the worker
+        # thread read while the API thread writes (unlike the pragmas
+        # above, journal_mode persists in the database file)
+        conn.execute('PRAGMA journal_mode=WAL')
+
         cursor = conn.cursor()
+
+        cursor.execute(_SQL_CREATE_JOBS)
+
+        # Migrate databases created before created_at_epoch existed:
+        # integer epoch comparisons beat lexicographic ISO-string ones
+        table_info = list(cursor.execute('PRAGMA table_info(print_jobs)'))
+        columns = [row[1] for row in table_info]
+        if 'created_at_epoch' not in columns:
+            cursor.execute('ALTER TABLE print_jobs ADD COLUMN created_at_epoch INTEGER')
+            cursor.execute('''
+                UPDATE print_jobs
+                SET created_at_epoch = strftime('%s', created_at)
+            ''')
+        if 'compressed' not in columns:
+            cursor.execute('ALTER TABLE print_jobs ADD COLUMN compressed INTEGER DEFAULT 0')
         
+        # Rebuild tables from pre-1.4 installs where job_id was a TEXT
+        # UUID primary key: CREATE TABLE IF NOT EXISTS keeps the old
+        # schema, and _SQL_INSERT_JOB omits job_id, so every new row
+        # would get a NULL key that no status update or claim can
+        # address. Rename-copy-drop gives the rows fresh rowid keys.
+        job_id_type = next((row[2] for row in table_info if row[1] == 'job_id'), '')
+        if job_id_type.upper() != 'INTEGER':
+            logger.info("Migrating print_jobs from TEXT to INTEGER job ids")
+            cursor.execute('ALTER TABLE print_jobs RENAME TO print_jobs_old')
+            cursor.execute(_SQL_CREATE_JOBS)
+            cursor.execute('''
+                INSERT INTO print_jobs (printer_name, document_name, document,
+                                        copies, options, status, error_message,
+                                        retry_count, created_at, updated_at,
+                                        completed_at, created_at_epoch, compressed)
+                SELECT printer_name, document_name, document,
+                       copies, options, status, error_message,
+                       retry_count, created_at, updated_at,
+                       completed_at,
+                       COALESCE(created_at_epoch, strftime('%s', created_at)),
+                       COALESCE(compressed, 0)
+                FROM print_jobs_old
+                ORDER BY created_at
+            ''')
+            # Old-table triggers and indexes followed the rename and go
+            # down with it; they are recreated below
+            cursor.execute('DROP TABLE print_jobs_old')
+        
+        # Compound index serves the worker's hot query
+        # (WHERE status=? ORDER BY created_at_epoch) as a single range
+        # scan; it replaces the old single-column idx_status
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS print_jobs (
-                job_id TEXT PRIMARY KEY,
-                printer_name TEXT NOT NULL,
-                document_name TEXT NOT NULL,
-                document BLOB NOT NULL,
-                copies INTEGER DEFAULT 1,
-                options TEXT,
-                status TEXT DEFAULT 'pending',
-                error_message TEXT,
-                retry_count INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                completed_at TIMESTAMP
-            )
+            DROP INDEX IF EXISTS idx_status_created
         ''')
-        
+
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_status ON print_jobs(status)
+            CREATE INDEX IF NOT EXISTS idx_status_created_epoch
+            ON print_jobs(status, created_at_epoch DESC)
         ''')
-        
+
+        cursor.execute('''
+            DROP INDEX IF EXISTS idx_status
+        ''')
+
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_created_at ON print_jobs(created_at)
         ''')
-        
+
+        # Per-status counters maintained by triggers so get_statistics
+        # never has to GROUP BY over the whole history table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_counts (
+                status TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_job_counts_insert
+            AFTER INSERT ON print_jobs
+            BEGIN
+                INSERT INTO job_counts(status, count) VALUES (NEW.status, 1)
+                ON CONFLICT(status) DO UPDATE SET count = count + 1;
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_job_counts_update
+            AFTER UPDATE OF status ON print_jobs
+            WHEN OLD.status != NEW.status
+            BEGIN
+                UPDATE job_counts SET count = count - 1 WHERE status = OLD.status;
+                INSERT INTO job_counts(status, count) VALUES (NEW.status, 1)
+                ON CONFLICT(status) DO UPDATE SET count = count + 1;
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_job_counts_delete
+            AFTER DELETE ON print_jobs
+            BEGIN
+                UPDATE job_counts SET count = count - 1 WHERE status = OLD.status;
+            END
+        ''')
+
+        # Reseed the counters from the real table so they stay honest
+        # across upgrades or counter drift
+        cursor.execute('DELETE FROM job_counts')
+        cursor.execute('''
+            INSERT INTO job_counts (status, count)
+            SELECT status, COUNT(*) FROM print_jobs GROUP BY status
+        ''')
+
         conn.commit()
         conn.close()
         
         logger.info(f"Job queue database initialized at {self.db_path}")
+
+    def _compress_document(self, document):
+        """Compress a document for storage when it's worth it
+
+        Returns (stored_value, compressed_flag): 0 = stored raw,
+        1 = compressed bytes, 2 = compressed text (restored to str on
+        read). Small documents aren't worth the CPU and stay raw.
+        """
+        if self._compressor is None:
+            return document, 0
+
+        if isinstance(document, str):
+            raw, flag = document.encode('utf-8'), 2
+        elif isinstance(document, (bytes, bytearray)):
+            raw, flag = bytes(document), 1
+        else:
+            return document, 0
+
+        if len(raw) <= _COMPRESS_THRESHOLD:
+            return document, 0
+
+        return _COMPRESS_MAGIC + self._compressor.compress(raw), flag
+
+    def _decompress_document(self, document, compressed):
+        """Restore a stored document to its original form"""
+        if not compressed or document is None:
+            return document
+
+        if self._decompressor is None:
+            raise RuntimeError(
+                "Job document is zstd-compressed but the zstandard "
+                "package is not installed"
+            )
+
+        raw = self._decompressor.decompress(bytes(document)[len(_COMPRESS_MAGIC):])
+        return raw.decode('utf-8') if compressed == 2 else raw
+
+    def _restore_job(self, job: 'Job') -> 'Job':
+        """Return a Job with its document transparently decompressed"""
+        if not job.compressed:
+            return job
+        return job._replace(
+            document=self._decompress_document(job.document, job.compressed)
+        )
     
     def submit_job(self, printer_name: str, document: str, document_name: str,
-                   copies: int = 1, options: dict = None) -> str:
-        """Submit a new print job to the queue"""
-        job_id = str(uuid.uuid4())
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+                   copies: int = 1, options: dict = None) -> int:
+        """Submit a new print job to the queue
+
+        Returns the integer job id. Integer rowid keys keep the primary
+        B-tree compact compared to the old 36-byte UUID strings.
+        """
+        stored, compressed = self._compress_document(document)
         
         try:
-            cursor.execute('''
-                INSERT INTO print_jobs (job_id, printer_name, document_name, document, 
-                                       copies, options, status)
-                VALUES (?, ?, ?, ?, ?, ?, 'pending')
-            ''', (
-                job_id,
+            cursor = self._conn().execute(_SQL_INSERT_JOB, (
                 printer_name,
                 document_name,
-                document,
+                stored,
                 copies,
-                json.dumps(options) if options else None
+                json.dumps(options) if options else None,
+                compressed
             ))
             
-            conn.commit()
-            logger.info(f"Job {job_id} submitted to queue")
+            job_id = cursor.lastrowid
+            logger.info("Job %s submitted to queue", job_id)
+            
+            with self._wake:
+                self._wake.notify()
+            
             return job_id
             
         except Exception as e:
             logger.error(f"Error submitting job: {e}", exc_info=True)
             raise
-        finally:
-            conn.close()
     
-    def get_job(self, job_id: str) -> Optional[Dict]:
+    def submit_jobs(self, jobs: List[dict]) -> List[int]:
+        """Submit a batch of print jobs in one transaction
+
+        Each entry takes the same fields as submit_job. The whole batch
+        is inserted with executemany under a single commit, so N jobs
+        share one fsync instead of paying one each.
+        """
+        if not jobs:
+            return []
+
+        rows = []
+        for job in jobs:
+            stored, compressed = self._compress_document(job['document'])
+            rows.append((
+                job['printer_name'],
+                job['document_name'],
+                stored,
+                job.get('copies', 1),
+                json.dumps(job['options']) if job.get('options') else None,
+                compressed
+            ))
+
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(_SQL_INSERT_JOB, rows)
+
+            # We hold the write lock, so the AUTOINCREMENT ids assigned
+            # to this batch are contiguous up to last_insert_rowid()
+            last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            job_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error submitting job batch: {e}", exc_info=True)
+            raise
+
+        logger.info(f"Submitted batch of {len(job_ids)} job(s) to queue")
+
+        with self._wake:
+            self._wake.notify()
+
+        return job_ids
+
+    def get_job(self, job_id: str) -> Optional[Job]:
         """Get job details"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._conn().execute('''
+            SELECT job_id, printer_name, document_name, document, copies, options,
+                   status, error_message, retry_count, created_at, 
+                   updated_at, completed_at, compressed
+            FROM print_jobs
+            WHERE job_id = ?
+        ''', (job_id,))
         
-        try:
-            cursor.execute('''
-                SELECT job_id, printer_name, document_name, document, copies, options,
-                       status, error_message, retry_count, created_at, 
-                       updated_at, completed_at
+        row = cursor.fetchone()
+        if row:
+            return self._restore_job(Job(*row))
+        return None
+    
+    def get_jobs(self, status: Optional[str] = None, limit: int = 50,
+                 include_document: bool = False) -> List[Job]:
+        """Get list of jobs, optionally filtered by status
+
+        The document BLOB can be megabytes per job, so list queries skip
+        it unless the caller explicitly asks for it.
+        """
+        conn = self._conn()
+
+        document_col = 'document' if include_document else 'NULL AS document'
+
+        if status:
+            cursor = conn.execute(f'''
+                SELECT job_id, printer_name, document_name, {document_col},
+                       copies, options, status, error_message, retry_count,
+                       created_at, updated_at, completed_at, compressed
                 FROM print_jobs
-                WHERE job_id = ?
-            ''', (job_id,))
-            
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
+                WHERE status = ?
+                ORDER BY created_at_epoch DESC
+                LIMIT ?
+            ''', (status, limit))
+        else:
+            cursor = conn.execute(f'''
+                SELECT job_id, printer_name, document_name, {document_col},
+                       copies, options, status, error_message, retry_count,
+                       created_at, updated_at, completed_at, compressed
+                FROM print_jobs
+                ORDER BY created_at_epoch DESC
+                LIMIT ?
+            ''', (limit,))
+
+        jobs = [Job(*row) for row in cursor.fetchall()]
+        if include_document:
+            jobs = [self._restore_job(job) for job in jobs]
+        return jobs
+
+    def open_job_document(self, job_id: str):
+        """Open a job's document BLOB for incremental reading
+
+        Returns a file-like handle (sqlite3 Blob) that streams the
+        document in chunks instead of materializing the full bytes in
+        memory, or None if the job doesn't exist. Falls back to an
+        in-memory BytesIO on Python < 3.11 where blobopen is missing.
+        The caller is responsible for closing the handle.
+        """
+        conn = self._conn()
+
+        row = conn.execute(
+            'SELECT rowid, compressed FROM print_jobs WHERE job_id = ?', (job_id,)
+        ).fetchone()
+        if row is None:
             return None
-            
-        finally:
-            conn.close()
-    
-    def get_jobs(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
-        """Get list of jobs, optionally filtered by status"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
+
+        if row[1]:
+            # Compressed rows can't be streamed directly; decompress
+            # into memory and serve that
+            from io import BytesIO
+            document = conn.execute(
+                'SELECT document FROM print_jobs WHERE job_id = ?', (job_id,)
+            ).fetchone()[0]
+            restored = self._decompress_document(document, row[1])
+            return BytesIO(restored.encode('utf-8')
+                           if isinstance(restored, str) else restored)
+
+        if hasattr(conn, 'blobopen'):
+            return conn.blobopen('print_jobs', 'document', row[0], readonly=True)
+
+        # Fallback: full materialization (pre-3.11 sqlite3 has no blobopen)
+        from io import BytesIO
+        document = conn.execute(
+            'SELECT document FROM print_jobs WHERE job_id = ?', (job_id,)
+        ).fetchone()
+        return BytesIO(document[0] if isinstance(document[0], bytes)
+                       else str(document[0]).encode())
+
+    def claim_pending(self, limit: int = 10) -> List[Job]:
+        """Atomically claim up to `limit` pending jobs: mark them
+        'processing' and return them in one statement, so a job can't be
+        double-claimed between a SELECT and a separate UPDATE"""
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
         try:
-            if status:
-                cursor.execute('''
-                    SELECT job_id, printer_name, document_name, document, copies, options,
-                           status, error_message, retry_count, created_at,
-                           updated_at, completed_at
-                    FROM print_jobs
-                    WHERE status = ?
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                ''', (status, limit))
+            if _HAS_RETURNING:
+                cursor = conn.execute('''
+                    UPDATE print_jobs
+                    SET status = 'processing', updated_at = CURRENT_TIMESTAMP
+                    WHERE job_id IN (
+                        SELECT job_id FROM print_jobs
+                        WHERE status = 'pending'
+                        ORDER BY created_at_epoch
+                        LIMIT ?
+                    )
+                    RETURNING job_id, printer_name, document_name, document, copies,
+                              options, status, error_message, retry_count, created_at,
+                              updated_at, completed_at, compressed
+                ''', (limit,))
+                rows = cursor.fetchall()
             else:
-                cursor.execute('''
-                    SELECT job_id, printer_name, document_name, document, copies, options,
-                           status, error_message, retry_count, created_at,
-                           updated_at, completed_at
-                    FROM print_jobs
-                    ORDER BY created_at DESC
+                # Older SQLite: BEGIN IMMEDIATE already holds the write
+                # lock, so SELECT-then-UPDATE inside it is just as
+                # atomic as RETURNING
+                ids = [row[0] for row in conn.execute('''
+                    SELECT job_id FROM print_jobs
+                    WHERE status = 'pending'
+                    ORDER BY created_at_epoch
                     LIMIT ?
-                ''', (limit,))
-            
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
-            
-        finally:
-            conn.close()
-    
+                ''', (limit,))]
+                rows = []
+                if ids:
+                    marks = ','.join('?' * len(ids))
+                    conn.execute(f'''
+                        UPDATE print_jobs
+                        SET status = 'processing', updated_at = CURRENT_TIMESTAMP
+                        WHERE job_id IN ({marks})
+                    ''', ids)
+                    rows = conn.execute(f'''
+                        SELECT job_id, printer_name, document_name, document, copies,
+                               options, status, error_message, retry_count, created_at,
+                               updated_at, completed_at, compressed
+                        FROM print_jobs
+                        WHERE job_id IN ({marks})
+                        ORDER BY created_at_epoch
+                    ''', ids).fetchall()
+
+            jobs = [self._restore_job(Job(*row)) for row in rows]
+            conn.commit()
+            return jobs
+
+        except Exception:
+            conn.rollback()
+            raise
+
     def update_job_status(self, job_id: str, status: str, error_message: str = None):
         """Update job status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn()
         
-        try:
-            if status == 'completed':
-                cursor.execute('''
-                    UPDATE print_jobs
-                    SET status = ?, updated_at = CURRENT_TIMESTAMP,
-                        completed_at = CURRENT_TIMESTAMP, error_message = ?
-                    WHERE job_id = ?
-                ''', (status, error_message, job_id))
-            else:
-                cursor.execute('''
-                    UPDATE print_jobs
-                    SET status = ?, updated_at = CURRENT_TIMESTAMP, error_message = ?
-                    WHERE job_id = ?
-                ''', (status, error_message, job_id))
-            
-            conn.commit()
-            
-        finally:
-            conn.close()
+        if status == 'completed':
+            conn.execute(_SQL_UPDATE_STATUS_COMPLETED, (status, error_message, job_id))
+        else:
+            conn.execute(_SQL_UPDATE_STATUS, (status, error_message, job_id))
     
     def increment_retry(self, job_id: str):
         """Increment retry count for a job"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                UPDATE print_jobs
-                SET retry_count = retry_count + 1, updated_at = CURRENT_TIMESTAMP
-                WHERE job_id = ?
-            ''', (job_id,))
-            
-            conn.commit()
-            
-        finally:
-            conn.close()
+        self._conn().execute(_SQL_INC_RETRY, (job_id,))
     
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a job"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn().execute(_SQL_CANCEL, (job_id,))
         
-        try:
-            cursor.execute('''
-                UPDATE print_jobs
-                SET status = 'cancelled', updated_at = CURRENT_TIMESTAMP
-                WHERE job_id = ? AND status IN ('pending', 'failed')
-            ''', (job_id,))
-            
-            conn.commit()
-            return cursor.rowcount > 0
-            
-        finally:
-            conn.close()
+        return cursor.rowcount > 0
     
     def cleanup_old_jobs(self):
         """Clean up old completed/failed/cancelled jobs"""
         retention_days = self.config.get('retention_days', 7)
-        cutoff_date = datetime.now() - timedelta(days=retention_days)
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cutoff_epoch = int((datetime.now() - timedelta(days=retention_days)).timestamp())
         
+        # Runs on a short-lived timer thread, so use a one-shot
+        # connection instead of leaving a thread-local one behind
+        conn = self._connect()
         try:
-            cursor.execute('''
+            cursor = conn.execute('''
                 DELETE FROM print_jobs
                 WHERE status IN ('completed', 'failed', 'cancelled')
-                AND created_at < ?
-            ''', (cutoff_date.isoformat(),))
+                AND created_at_epoch < ?
+            ''', (cutoff_epoch,))
+            
+            if cursor.rowcount > 0:
+                logger.info(f"Cleaned up {cursor.rowcount} old job(s)")
             
-            deleted = cursor.rowcount
             conn.commit()
             
-            if deleted > 0:
-                logger.info(f"Cleaned up {deleted} old job(s)")
+            # Hand freed pages back to the filesystem
+            conn.execute('PRAGMA incremental_vacuum(1000)')
             
         except Exception as e:
             logger.error(f"Error cleaning up jobs: {e}", exc_info=True)
         finally:
             conn.close()
+
+    def _run_cleanup_timer(self):
+        """Run cleanup and re-arm the hourly timer"""
+        self.cleanup_old_jobs()
+        if self.running:
+            self._cleanup_timer = threading.Timer(3600, self._run_cleanup_timer)
+            self._cleanup_timer.daemon = True
+            self._cleanup_timer.start()
     
-    def get_statistics(self) -> Dict:
+    def get_statistics(self) -> dict:
         """Get job statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Trigger-maintained counters: ~5 rows regardless of history size
+        cursor = self._conn().execute('''
+            SELECT status, count FROM job_counts WHERE count > 0
+        ''')
         
-        try:
-            stats = {}
-            
-            # Count by status
-            cursor.execute('''
-                SELECT status, COUNT(*) as count
-                FROM print_jobs
-                GROUP BY status
-            ''')
-            
-            for row in cursor.fetchall():
-                stats[row[0]] = row[1]
-            
-            # Total jobs
-            cursor.execute('SELECT COUNT(*) FROM print_jobs')
-            stats['total'] = cursor.fetchone()[0]
-            
-            return stats
-            
-        finally:
-            conn.close()
+        stats = {row[0]: row[1] for row in cursor.fetchall()}
+        stats['total'] = sum(stats.values())
+        
+        return stats
     
     def get_uptime(self) -> str:
         """Get server uptime"""
@@ -281,84 +638,152 @@ class JobQueue:
             return
         
         self.running = True
+        if self.printer_manager is None:
+            self.printer_manager = PrinterManager(self.config)
         self.worker_thread = threading.Thread(target=self._process_queue, daemon=True)
         self.worker_thread.start()
+        
+        # Hourly cleanup runs on its own timer instead of every worker tick
+        self._run_cleanup_timer()
+        
         logger.info("Job queue processor started")
     
     def stop(self):
         """Stop job queue processor"""
         self.running = False
+        if self._cleanup_timer:
+            self._cleanup_timer.cancel()
+        with self._wake:
+            self._wake.notify_all()
         if self.worker_thread:
             self.worker_thread.join(timeout=5)
+        
+        # Close all thread-local connections
+        with self._conns_lock:
+            for conn in self._all_conns:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._all_conns.clear()
+        
         logger.info("Job queue processor stopped")
     
+    def _print_jobs(self, printer_manager, jobs: List[Job]) -> List[tuple]:
+        """Print one printer's claimed jobs serially (preserves per-printer
+        ordering) and return (job_id, outcome, error_message) tuples for
+        the DB flusher. Runs on a worker-pool thread; touches no DB."""
+        max_retries = self.config.get('max_retries', 3)
+        results = []
+
+        for job in jobs:
+            job_id = job.job_id
+
+            if not self.running:
+                # Shutting down: put unprinted jobs back in the queue
+                results.append((job_id, 'pending', None))
+                continue
+
+            try:
+                # Parse options
+                options = None
+                if job.options:
+                    options = json.loads(job.options)
+
+                # Attempt to print
+                success = printer_manager.print_document(
+                    printer_name=job.printer_name,
+                    document=job.document,
+                    document_name=job.document_name,
+                    copies=job.copies,
+                    options=options
+                )
+
+                if success:
+                    results.append((job_id, 'completed', None))
+                    logger.info(f"Job {job_id} completed successfully")
+                else:
+                    # Print failed; the cached printer list may be stale
+                    # (renamed/removed queue), so force a re-discovery
+                    # before any retry
+                    printer_manager.invalidate_printers()
+                    retry_count = job.retry_count + 1
+
+                    if retry_count >= max_retries:
+                        results.append((
+                            job_id, 'failed',
+                            f"Failed after {retry_count} attempts"
+                        ))
+                        logger.error(f"Job {job_id} failed after {retry_count} attempts")
+                    else:
+                        results.append((
+                            job_id, 'retry',
+                            f"Retry {retry_count}/{max_retries}"
+                        ))
+                        logger.warning(f"Job {job_id} failed, will retry ({retry_count}/{max_retries})")
+
+            except Exception as e:
+                logger.error(f"Error processing job {job_id}: {e}", exc_info=True)
+                results.append((job_id, 'failed', str(e)))
+
+        return results
+
     def _process_queue(self):
         """Background thread to process pending jobs"""
-        from printer_manager import PrinterManager
-        
-        printer_manager = PrinterManager(self.config)
-        max_retries = self.config.get('max_retries', 3)
-        
+        executor = ThreadPoolExecutor(
+            max_workers=self.config.get('print_workers', 4),
+            thread_name_prefix='print-worker'
+        )
+
         while self.running:
             try:
-                # Get pending jobs
-                pending_jobs = self.get_jobs(status='pending', limit=10)
-                
-                for job in pending_jobs:
-                    if not self.running:
-                        break
-                    
-                    job_id = job['job_id']
-                    
+                # Atomically claim pending jobs (marks them 'processing')
+                pending_jobs = self.claim_pending(limit=10)
+
+                if pending_jobs:
+                    # One task per printer: distinct printers print in
+                    # parallel while each printer's jobs stay ordered
+                    by_printer = {}
+                    for job in pending_jobs:
+                        by_printer.setdefault(job.printer_name, []).append(job)
+
+                    futures = [
+                        executor.submit(self._print_jobs, self.printer_manager, jobs)
+                        for jobs in by_printer.values()
+                    ]
+
+                    results = []
+                    for future in futures:
+                        results.extend(future.result())
+
+                    # Flush this tick's outcomes in a single transaction
+                    # so up to 10 jobs share one commit/fsync
+                    conn = self._conn()
+                    conn.execute('BEGIN IMMEDIATE')
                     try:
-                        # Update status to processing
-                        self.update_job_status(job_id, 'processing')
-                        
-                        # Parse options
-                        options = None
-                        if job['options']:
-                            options = json.loads(job['options'])
-                        
-                        # Attempt to print
-                        success = printer_manager.print_document(
-                            printer_name=job['printer_name'],
-                            document=job['document'],
-                            document_name=job['document_name'],
-                            copies=job['copies'],
-                            options=options
-                        )
-                        
-                        if success:
-                            self.update_job_status(job_id, 'completed')
-                            logger.info(f"Job {job_id} completed successfully")
-                        else:
-                            # Print failed
-                            self.increment_retry(job_id)
-                            retry_count = job['retry_count'] + 1
-                            
-                            if retry_count >= max_retries:
-                                self.update_job_status(
-                                    job_id, 'failed',
-                                    f"Failed after {retry_count} attempts"
-                                )
-                                logger.error(f"Job {job_id} failed after {retry_count} attempts")
+                        for job_id, outcome, error_message in results:
+                            if outcome == 'retry':
+                                self.increment_retry(job_id)
+                                self.update_job_status(job_id, 'pending', error_message)
                             else:
-                                self.update_job_status(
-                                    job_id, 'pending',
-                                    f"Retry {retry_count}/{max_retries}"
-                                )
-                                logger.warning(f"Job {job_id} failed, will retry ({retry_count}/{max_retries})")
-                                
-                    except Exception as e:
-                        logger.error(f"Error processing job {job_id}: {e}", exc_info=True)
-                        self.update_job_status(job_id, 'failed', str(e))
-                
-                # Cleanup old jobs periodically
-                self.cleanup_old_jobs()
-                
-                # Sleep before next iteration
-                time.sleep(2)
+                                self.update_job_status(job_id, outcome, error_message)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+
+                # Wait for the next submission, with a 2s floor so
+                # retries and cleanup still get scheduled when idle
+                with self._wake:
+                    self._wake.wait(timeout=2)
                 
             except Exception as e:
                 logger.error(f"Error in job queue processor: {e}", exc_info=True)
+                try:
+                    # Don't leave a batch transaction open across the retry sleep
+                    self._conn().rollback()
+                except Exception:
+                    pass
                 time.sleep(5)
+
+        executor.shutdown(wait=False)
@@ -5,19 +5,38 @@ This allows the print server to work behind NAT/firewall
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import threading
 import time
+from collections import defaultdict
+import queue
 import base64
+import hashlib
 import tempfile
+import shutil
+import gzip
 import os
 import sys
 import platform
 from typing import Optional, Dict, List
 from pathlib import Path
 
+# orjson decodes response bytes directly in C, several times faster than
+# the stdlib json used by response.json(); fall back gracefully if the
+# wheel is unavailable on some target platform
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Sentinel returned by _make_request for a 304 Not Modified response,
+# so callers can skip JSON parsing entirely
+NOT_MODIFIED = object()
+
 # Windows SSL certificate fix
 def get_ssl_cert_path():
     """Get the SSL certificate bundle path, with Windows fix"""
@@ -49,9 +68,53 @@ class OdooClient:
         self.config = config.get('odoo', {})
         self.printer_manager = printer_manager
         self.enabled = self.config.get('enabled', False)
-        self.poll_interval = self.config.get('poll_interval', 10)  # seconds
+        # How long Odoo may hold the pending-jobs request open before
+        # answering (long-polling). Cast once: the wait/timeout
+        # arithmetic wants a number, not whatever YAML happened to
+        # parse (e.g. a string from an edited config). The old
+        # poll_interval key is unused since the long-poll rewrite.
+        self.long_poll_timeout = int(self.config.get('long_poll_timeout', 55))  # seconds
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self.heartbeat_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        
+        # Producer/consumer split: the poll thread only enqueues jobs,
+        # a small worker pool does the download/print I/O. A slow 200MB
+        # download can no longer hold up the next poll or heartbeat.
+        # The bound gives Odoo backpressure instead of unbounded RAM use.
+        self.job_queue: queue.Queue = queue.Queue(maxsize=256)
+        self.max_workers = self.config.get('max_parallel_jobs', 4)
+        self.workers: List[threading.Thread] = []
+        # Jobs for the same printer still serialize on its lock so
+        # output order is preserved
+        self._printer_locks = defaultdict(threading.Lock)
+        
+        # Scratch directory for downloaded documents. Each worker thread
+        # reuses one file per extension (truncate-and-rewrite) instead of
+        # a create/unlink metadata transaction per job, and /dev/shm puts
+        # ephemeral spool files in RAM where the kernel supports it
+        self._scratch_dir = tempfile.mkdtemp(
+            prefix='odoo-print-',
+            dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+        
+        # Last ETag seen per endpoint, for conditional GETs: a 304 from
+        # Odoo means "nothing changed" in ~100 bytes instead of a full
+        # JSON envelope on every idle poll
+        self._etag_cache: Dict[str, str] = {}
+        
+        # Heartbeat printer-list cache: re-enumerating printers hits the
+        # spooler (RPC on Windows, cupsd on Linux), so refresh at most
+        # every 5 minutes and send only a hash when nothing changed
+        self._printers_cache: List[dict] = []
+        self._printers_hash: Optional[str] = None
+        self._printers_refreshed: float = 0.0
+        
+        # Completed-job status updates queued for a single bulk POST
+        # after each batch; failures still flush immediately so the
+        # server can schedule a retry without waiting
+        self._pending_status: List[dict] = []
+        self._status_lock = threading.Lock()
         
         # Odoo connection settings
         self.odoo_url = self.config.get('url', '').rstrip('/')
@@ -59,10 +122,53 @@ class OdooClient:
         self.api_key = self.config.get('api_key', '')
         self.server_id = self.config.get('server_id')  # Print server ID in Odoo
         
+        # Full URLs for the fixed endpoints, built once; _make_request
+        # hits this cache instead of concatenating per call
+        self._urls = {
+            endpoint: self.odoo_url + endpoint
+            for endpoint in (
+                '/api/v1/print/jobs/pending',
+                '/api/v1/print/server/heartbeat',
+                '/api/v1/print/jobs/bulk-update',
+                '/api/v1/print/server/register',
+                '/api/v1/print/ping',
+            )
+        }
+        
         # Session with SSL handling for Windows
         self.session = requests.Session()
+        
+        # Pooled keep-alive connections: polling, heartbeat, claims and
+        # downloads all reuse warm TCP+TLS connections instead of paying
+        # a fresh handshake, with retries on transient gateway errors.
+        # HTTP/2 multiplexing (httpx + h2) was considered here; with a
+        # pool of parallel HTTP/1.1 connections a long download already
+        # can't stall the next poll, so the extra dependency isn't worth
+        # it for a frozen single-purpose client
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods={'GET', 'POST'}
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Static headers set once on the session so each request doesn't
+        # rebuild the same dict
         self.session.headers.update({
             'Content-Type': 'application/json',
+            'Connection': 'keep-alive',
+            # 'br' engages only when the brotli package is importable
+            # by urllib3; gzip always works
+            'Accept-Encoding': 'gzip, br',
+            'Authorization': f'Bearer {self.api_key}',
+            'DATABASE': self.database,
+            'X-Server-Name': self.config.get('server_name', 'Print Server'),
         })
         
         # Configure SSL verification
@@ -92,60 +198,127 @@ class OdooClient:
             return
         
         self.running = True
+        self._stop_event.clear()
+        self.workers = [
+            threading.Thread(target=self._worker_loop, daemon=True,
+                             name=f'odoo-job-{i}')
+            for i in range(self.max_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
         self.thread = threading.Thread(target=self._poll_loop, daemon=True)
         self.thread.start()
-        logger.info(f"Odoo client started - polling {self.odoo_url} every {self.poll_interval}s")
+        self.heartbeat_thread = threading.Thread(target=self._heartbeat_loop,
+                                                 daemon=True, name='odoo-heartbeat')
+        self.heartbeat_thread.start()
+        logger.info(f"Odoo client started - long-polling {self.odoo_url} (timeout {self.long_poll_timeout}s)")
     
     def stop(self):
         """Stop the polling thread"""
         self.running = False
+        self._stop_event.set()
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5)
+        if self.heartbeat_thread and self.heartbeat_thread.is_alive():
+            self.heartbeat_thread.join(timeout=5)
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.join(timeout=1)
+        # Workers are gone; report whatever completions are still queued
+        # so they aren't lost at shutdown
+        try:
+            self._flush_status_updates()
+        except Exception as e:
+            logger.error(f"Error flushing final status updates: {e}")
+        shutil.rmtree(self._scratch_dir, ignore_errors=True)
         logger.info("Odoo client stopped")
     
     def _poll_loop(self):
-        """Main polling loop"""
-        heartbeat_counter = 0
+        """Main polling loop
+        
+        Uses long-polling: Odoo holds the pending-jobs request open
+        until a job arrives or the wait timeout fires, so we re-issue
+        immediately on return instead of sleeping a fixed interval.
+        """
         while self.running:
+            found_jobs = False
             try:
-                # Send heartbeat every 3rd poll (every 30 seconds at default 10s interval)
-                if heartbeat_counter % 3 == 0:
-                    self._send_heartbeat()
-                heartbeat_counter += 1
-                
-                self._check_and_process_jobs()
+                found_jobs = self._check_and_process_jobs()
             except Exception as e:
                 logger.error(f"Error in poll loop: {e}", exc_info=True)
             
-            # Sleep in small intervals to allow quick shutdown
-            for _ in range(int(self.poll_interval)):
-                if not self.running:
-                    break
-                time.sleep(1)
+            # Piggyback any completions the workers queued since the
+            # last cycle
+            try:
+                self._flush_status_updates()
+            except Exception as e:
+                logger.error(f"Error flushing status updates: {e}")
+            
+            if not found_jobs:
+                # Brief back-off so a server without long-poll support
+                # (which answers empty immediately) isn't tight-looped;
+                # the event wakes us instantly on stop()
+                self._stop_event.wait(1)
+    
+    def _heartbeat_loop(self):
+        """Send heartbeats on their own 30-second clock
+
+        The poll thread can sit inside a long-poll for up to
+        long_poll_timeout seconds, which would stretch a poll-loop
+        heartbeat cadence to ~double the 30s the Odoo side expects.
+        """
+        while self.running:
+            try:
+                self._send_heartbeat()
+            except Exception as e:
+                logger.error(f"Error in heartbeat loop: {e}")
+            self._stop_event.wait(30)
     
     def _send_heartbeat(self):
         """Send heartbeat to Odoo with printer information"""
         try:
-            # Get list of printers from printer manager
-            printers = []
-            if self.printer_manager:
-                printer_list = self.printer_manager.get_printers()
-                for p in printer_list:
+            # Refresh the printer list at most every 5 minutes; between
+            # refreshes the cached snapshot is authoritative
+            now = time.monotonic()
+            if self.printer_manager and (
+                    not self._printers_refreshed
+                    or now - self._printers_refreshed > 300):
+                printers = []
+                for p in self.printer_manager.get_printers():
                     printers.append({
                         'name': p.get('name', ''),
                         'description': p.get('description', p.get('name', '')),
                         'location': p.get('location', ''),
                         'status': p.get('status', 'ready')
                     })
+                self._printers_cache = printers
+                self._printers_refreshed = now
+            printers = self._printers_cache
             
-            data = {
-                'printers': printers,
-                'server_name': self.config.get('server_name', 'Print Server')
-            }
+            h = hashlib.blake2b(
+                repr(sorted(sorted(p.items()) for p in printers)).encode(),
+                digest_size=16).hexdigest()
+            
+            if h == self._printers_hash:
+                # Unchanged since the last heartbeat: send just the hash
+                # (~40 bytes) and let the server treat it as a no-op
+                data = {
+                    'printers_hash': h,
+                    'server_name': self.config.get('server_name', 'Print Server')
+                }
+            else:
+                data = {
+                    'printers': printers,
+                    'printers_hash': h,
+                    'server_name': self.config.get('server_name', 'Print Server')
+                }
+            # Real backlog depth lets Odoo route jobs to a quieter server
+            data['queued_jobs'] = self.job_queue.qsize()
             
             result = self._make_request('/api/v1/print/server/heartbeat', method='POST', data=data)
             
             if result and result.get('success'):
+                self._printers_hash = h
                 logger.debug(f"Heartbeat sent - {len(printers)} printer(s) synced")
             else:
                 logger.warning(f"Heartbeat failed: {result}")
@@ -153,39 +326,58 @@ class OdooClient:
         except Exception as e:
             logger.error(f"Error sending heartbeat: {e}")
     
-    def _make_request(self, endpoint: str, method: str = 'GET', data: dict = None) -> Optional[dict]:
+    def _make_request(self, endpoint: str, method: str = 'GET', data: dict = None,
+                      params: dict = None, timeout: int = 30) -> Optional[dict]:
         """Make authenticated request to Odoo"""
-        url = f"{self.odoo_url}{endpoint}"
-        
-        # Get server name from config
-        server_name = self.config.get('server_name', 'Print Server')
-        
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'DATABASE': self.database,
-            'X-Server-Name': server_name,
-        }
+        url = self._urls.get(endpoint) or self.odoo_url + endpoint
         
-        # Extended debug logging
-        logger.debug(f"=== Making {method} request ===")
-        logger.debug(f"  URL: {url}")
-        logger.debug(f"  Database: {self.database}")
-        logger.debug(f"  API Key: {self.api_key[:8]}..." if self.api_key else "  API Key: (not set)")
-        logger.debug(f"  Server Name: {server_name}")
+        # Extended debug logging (auth headers live on the session).
+        # Guarded so the hot polling path never pays for stringifying
+        # headers/bodies that INFO-level handlers would discard anyway.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"=== Making {method} request ===")
+            logger.debug(f"  URL: {url}")
+            logger.debug(f"  Database: {self.database}")
+            logger.debug(f"  API Key: {self.api_key[:8]}..." if self.api_key else "  API Key: (not set)")
         
         try:
             if method == 'GET':
-                response = self.session.get(url, headers=headers, timeout=30)
+                # Conditional GET: replay the endpoint's last ETag so an
+                # unchanged resource comes back as an empty 304. Auth
+                # headers live on the session; headers=None skips the
+                # per-call merge entirely when there is no ETag yet.
+                etag = self._etag_cache.get(endpoint)
+                headers = {'If-None-Match': etag} if etag else None
+                # params= URL-encodes and orders keys consistently, which
+                # keeps URLs canonical for connection/cache reuse
+                response = self.session.get(url, headers=headers, params=params,
+                                            timeout=timeout)
             elif method == 'POST':
-                response = self.session.post(url, headers=headers, json=data, timeout=30)
+                if orjson is not None:
+                    # Serialize ourselves: orjson.dumps emits UTF-8 bytes
+                    # directly, skipping requests' json.dumps + re-encode
+                    # (Content-Type is already on the session headers)
+                    body = orjson.dumps(data)
+                    headers = None
+                    if len(body) > 1024:
+                        # Large payloads (full heartbeats, bulk updates)
+                        # compress 5-10x; level 1 keeps CPU negligible
+                        body = gzip.compress(body, compresslevel=1)
+                        headers = {'Content-Encoding': 'gzip'}
+                    response = self.session.post(url, data=body,
+                                                 headers=headers, timeout=timeout)
+                else:
+                    response = self.session.post(url, json=data, timeout=timeout)
             else:
                 raise ValueError(f"Unsupported method: {method}")
             
             # Log response details
-            logger.debug(f"  Response Status: {response.status_code}")
-            logger.debug(f"  Response Headers: {dict(response.headers)}")
             content_type = response.headers.get('Content-Type', '')
-            logger.debug(f"  Content-Type: {content_type}")
+            if debug:
+                logger.debug(f"  Response Status: {response.status_code}")
+                logger.debug(f"  Response Headers: {dict(response.headers)}")
+                logger.debug(f"  Content-Type: {content_type}")
             
             # Check if response is HTML instead of JSON
             if 'text/html' in content_type:
@@ -197,10 +389,21 @@ class OdooClient:
                 logger.error(f"    3. There's a proxy/firewall intercepting the request")
                 return None
             
+            if response.status_code == 304:
+                logger.debug("  Not modified (ETag match)")
+                return NOT_MODIFIED
+            
             if response.status_code == 200:
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._etag_cache[endpoint] = etag
                 try:
-                    json_response = response.json()
-                    logger.debug(f"  JSON Response: {json_response}")
+                    if orjson is not None:
+                        json_response = orjson.loads(response.content)
+                    else:
+                        json_response = response.json()
+                    if debug:
+                        logger.debug(f"  JSON Response: {json_response}")
                     return json_response
                 except Exception as json_err:
                     logger.error(f"  Failed to parse JSON: {json_err}")
@@ -237,34 +440,75 @@ class OdooClient:
             logger.error(f"  Traceback: {traceback.format_exc()}")
             return None
     
-    def _check_and_process_jobs(self):
-        """Check for pending jobs and process them"""
-        # Get pending jobs for this print server
-        params = {}
+    def _check_and_process_jobs(self) -> bool:
+        """Check for pending jobs and process them
+        
+        Returns True when jobs were received, so the poll loop can
+        re-issue immediately instead of backing off.
+        """
+        # Get pending jobs for this print server; 'wait' asks Odoo to
+        # hold the request open until a job arrives (long-polling), and
+        # 'claim' asks it to mark the returned jobs processing in the
+        # same transaction so we skip a claim round-trip per job
+        params = {'wait': self.long_poll_timeout, 'claim': 1, 'max': 50}
         if self.server_id:
             params['server_id'] = self.server_id
         
         endpoint = '/api/v1/print/jobs/pending'
-        if params:
-            endpoint += '?' + '&'.join(f"{k}={v}" for k, v in params.items())
         
-        result = self._make_request(endpoint)
+        result = self._make_request(endpoint, params=params,
+                                    timeout=self.long_poll_timeout + 5)
         
-        if not result:
-            return
+        if result is NOT_MODIFIED or not result:
+            return False
         
         jobs = result.get('jobs', [])
         if not jobs:
             logger.debug("No pending jobs")
-            return
+            return False
         
         logger.info(f"Found {len(jobs)} pending job(s)")
         
+        # Older server modules ignore 'claim' and expect the per-job
+        # claim POST; they signal support by echoing claimed=True
+        claimed = bool(result.get('claimed'))
+        
+        # Hand the batch to the workers and go straight back to polling;
+        # blocks only if the queue is full (backpressure)
         for job in jobs:
-            self._process_job(job)
+            self.job_queue.put((job, claimed))
+        
+        return True
+    
+    def _worker_loop(self):
+        """Consume jobs from the queue until stop() is called"""
+        while self.running:
+            try:
+                job, claimed = self.job_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            try:
+                self._process_job(job, claimed)
+            except Exception as e:
+                logger.error(f"Worker error processing job: {e}", exc_info=True)
+            finally:
+                self.job_queue.task_done()
+            
+            # Flush completions as soon as the batch drains instead of
+            # waiting out the poll thread's long-poll (up to ~55s);
+            # concurrent flushes are safe, each swaps out its own batch
+            if self.job_queue.empty():
+                try:
+                    self._flush_status_updates()
+                except Exception as e:
+                    logger.error(f"Error flushing status updates: {e}")
     
-    def _process_job(self, job: dict):
-        """Process a single print job"""
+    def _process_job(self, job: dict, claimed: bool = False):
+        """Process a single print job
+
+        claimed=True means the pending fetch already marked the job as
+        processing server-side, so the per-job claim POST is skipped.
+        """
         job_id = job.get('id')
         printer_name = job.get('printer_name')
         document_type = job.get('document_type', 'pdf')
@@ -283,40 +527,102 @@ class OdooClient:
         logger.info(f"Processing job {job_id} for printer {printer_name}")
         
         try:
-            # Mark job as processing (claim it)
-            claim_result = self._make_request(f'/api/v1/print/jobs/{job_id}/claim', method='POST')
-            if not claim_result or not claim_result.get('success'):
-                logger.warning(f"Failed to claim job {job_id}, skipping")
-                return
+            # Mark job as processing (claim it) unless the batch fetch
+            # already did
+            if not claimed:
+                claim_result = self._make_request('/api/v1/print/jobs/%s/claim' % job_id, method='POST')
+                if not claim_result or not claim_result.get('success'):
+                    logger.warning(f"Failed to claim job {job_id}, skipping")
+                    return
             
             # Get the document content - try various field names
             content_b64 = job.get('document_data') or job.get('content') or job.get('file_data')
             content_url = job.get('content_url') or job.get('document_url')
             
-            if content_url:
-                # Download content from URL
-                content = self._download_content(content_url)
+            # Determine file extension
+            if document_type == 'pdf':
+                suffix = '.pdf'
+            elif document_type in ('raw', 'text'):
+                suffix = '.txt'
+            else:
+                suffix = '.pdf'  # Default to PDF
+            
+            options = job.get('options', {})
+            copies = options.get('copies', 1) if options else 1
+            document_name = f"odoo_job{suffix}"
+
+            if content_url and suffix == '.pdf' and self.printer_manager.supports_streaming():
+                # CUPS accepts stdin, so pipe the download straight from
+                # the HTTP response into lp — the document never touches
+                # disk at all
+                success = self._stream_url_to_printer(
+                    content_url, printer_name, document_name, copies, options)
+            elif content_url:
+                # Spool the download to a scratch file: the body streams
+                # to it in 64KB chunks and printing hands the spooler a
+                # path, so the document is never fully resident in
+                # memory. On Linux the file is truncated and reused by
+                # the next job on this thread; on Windows the
+                # ShellExecute print fallback is asynchronous and may
+                # still be reading the path after print_file returns, so
+                # each job gets its own file, deleted after a grace
+                # period via the printer manager's reaper.
+                if sys.platform == 'win32':
+                    fd, temp_path = tempfile.mkstemp(
+                        suffix=suffix, dir=self._scratch_dir)
+                    os.close(fd)
+                else:
+                    temp_path = os.path.join(
+                        self._scratch_dir,
+                        f'job-{threading.get_ident()}{suffix}')
+                try:
+                    with open(temp_path, 'wb') as temp_file:
+                        if not self._download_content(content_url, temp_file):
+                            raise ValueError("Failed to get job content")
+
+                    if os.path.getsize(temp_path) == 0:
+                        raise ValueError("Failed to get job content")
+
+                    # Serialize per printer so parallel jobs can't
+                    # interleave output on one device
+                    with self._printer_locks[printer_name]:
+                        success = self.printer_manager.print_file(
+                            printer_name=printer_name,
+                            file_path=temp_path,
+                            document_name=document_name,
+                            copies=copies,
+                            options=options
+                        )
+                finally:
+                    if sys.platform == 'win32':
+                        self.printer_manager._cleanup_file_later(temp_path,
+                                                                 delay=60)
             elif content_b64:
-                # Content is inline (base64 encoded)
-                content = base64.b64decode(content_b64)
+                # Inline content: decode the base64 exactly once and hand
+                # the raw bytes straight to the printer manager — no
+                # decode/re-encode round-trip and no extra temp file here
+                data = base64.b64decode(content_b64)
+                if not data:
+                    raise ValueError("Failed to get job content")
+
+                with self._printer_locks[printer_name]:
+                    success = self.printer_manager.print_document_bytes(
+                        printer_name=printer_name,
+                        data=data,
+                        document_name=document_name,
+                        copies=copies,
+                        options=options
+                    )
             else:
                 raise ValueError("No document data in job")
-            
-            if not content:
-                raise ValueError("Failed to get job content")
-            
-            # Print the document
-            success = self._print_document(
-                printer_name=printer_name,
-                content=content,
-                content_type=document_type,
-                options=job.get('options', {})
-            )
-            
+
             if success:
                 self._update_job_status(job_id, 'completed')
                 logger.info(f"Job {job_id} completed successfully")
             else:
+                # The cached printer list may be stale (renamed/removed
+                # queue); drop it so the next attempt re-discovers
+                self.printer_manager.invalidate_printers()
                 self._update_job_status(job_id, 'failed', 'Print failed')
                 logger.error(f"Job {job_id} failed")
                 
@@ -324,72 +630,104 @@ class OdooClient:
             logger.error(f"Error processing job {job_id}: {e}", exc_info=True)
             self._update_job_status(job_id, 'failed', str(e))
     
-    def _download_content(self, url: str) -> Optional[bytes]:
-        """Download content from URL"""
+    def _stream_url_to_printer(self, url: str, printer_name: str,
+                               document_name: str, copies: int,
+                               options: dict) -> bool:
+        """Pipe a download straight into the printer, bypassing disk"""
+        headers = {}
+        if not url.startswith(self.odoo_url):
+            headers = {'Authorization': None, 'DATABASE': None}
+
+        with self.session.get(url, headers=headers, stream=True, timeout=60) as response:
+            if response.status_code != 200:
+                raise ValueError(f"Failed to get job content: {response.status_code}")
+
+            # Let urllib3 undo any transfer encoding before lp sees it
+            response.raw.decode_content = True
+
+            with self._printer_locks[printer_name]:
+                return self.printer_manager.print_stream(
+                    printer_name=printer_name,
+                    fileobj=response.raw,
+                    document_name=document_name,
+                    copies=copies,
+                    options=options
+                )
+
+    def _download_content(self, url: str, dest_file) -> bool:
+        """Stream content from URL into an open binary file
+
+        Writes in 64KB chunks so large documents never sit fully in
+        memory. Returns True on success.
+        """
         try:
-            # Add authentication if it's an Odoo URL
+            # The session carries Odoo auth headers by default; strip
+            # them when downloading from a third-party URL
             headers = {}
-            if url.startswith(self.odoo_url):
-                headers['Authorization'] = f'Bearer {self.api_key}'
-                headers['DATABASE'] = self.database
-            
-            response = self.session.get(url, headers=headers, timeout=60)
-            if response.status_code == 200:
-                return response.content
-            else:
-                logger.error(f"Failed to download content: {response.status_code}")
-                return None
-        except Exception as e:
-            logger.error(f"Error downloading content: {e}")
-            return None
-    
-    def _print_document(self, printer_name: str, content: bytes, 
-                        content_type: str, options: dict) -> bool:
-        """Print document using printer manager"""
-        try:
-            # Determine file extension
-            if content_type == 'pdf':
-                suffix = '.pdf'
-            elif content_type in ('raw', 'text'):
-                suffix = '.txt'
-            else:
-                suffix = '.pdf'  # Default to PDF
+            if not url.startswith(self.odoo_url):
+                headers = {'Authorization': None, 'DATABASE': None}
             
-            # Re-encode content to base64 for printer manager
-            document_b64 = base64.b64encode(content).decode('utf-8')
-            document_name = f"odoo_job{suffix}"
-            
-            # Extract options
-            copies = options.get('copies', 1) if options else 1
+            with self.session.get(url, headers=headers, stream=True, timeout=60) as response:
+                if response.status_code != 200:
+                    logger.error(f"Failed to download content: {response.status_code}")
+                    return False
+                
+                for chunk in response.iter_content(64 * 1024):
+                    dest_file.write(chunk)
             
-            # Use printer manager to print
-            result = self.printer_manager.print_document(
-                printer_name=printer_name,
-                document=document_b64,
-                document_name=document_name,
-                copies=copies,
-                options=options
-            )
-            return result
-                    
+            return True
         except Exception as e:
-            logger.error(f"Print error: {e}")
+            logger.error(f"Error downloading content: {e}")
             return False
     
     def _update_job_status(self, job_id: int, status: str, error_message: str = None):
-        """Update job status in Odoo"""
+        """Update job status in Odoo
+
+        Completions are queued and flushed in one bulk request per batch
+        (see _flush_status_updates); failures post immediately so the
+        server can retry without waiting for the batch to drain.
+        """
         data = {
+            'id': job_id,
             'status': status,
         }
         if error_message:
             data['error'] = error_message
         
-        result = self._make_request(f'/api/v1/print/jobs/{job_id}/update', method='POST', data=data)
+        if status != 'failed':
+            with self._status_lock:
+                self._pending_status.append(data)
+            return
+        
+        result = self._make_request('/api/v1/print/jobs/%s/update' % job_id, method='POST',
+                                    data={k: v for k, v in data.items() if k != 'id'})
         if result:
             logger.info(f"Job {job_id} status updated to {status}")
         else:
             logger.warning(f"Failed to update job {job_id} status to {status}")
     
+    def _flush_status_updates(self):
+        """Send all queued status updates in one bulk POST"""
+        with self._status_lock:
+            updates, self._pending_status = self._pending_status, []
+        
+        if not updates:
+            return
+        
+        result = self._make_request('/api/v1/print/jobs/bulk-update', method='POST',
+                                    data={'updates': updates})
+        if result:
+            logger.info(f"Flushed {len(updates)} job status update(s)")
+            return
+        
+        # Bulk endpoint unavailable (older Odoo module): fall back to
+        # per-job updates so nothing is lost
+        logger.warning("Bulk update failed, falling back to per-job updates")
+        for update in updates:
+            data = {k: v for k, v in update.items() if k != 'id'}
+            self._make_request(f"/api/v1/print/jobs/{update['id']}/update",
+                               method='POST', data=data)
+    
     def register_server(self) -> bool:
         """Register this print server with Odoo"""
         if not self.enabled:
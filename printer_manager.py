@@ -4,16 +4,234 @@ Supports CUPS (Linux) and Win32 (Windows)
 
 import os
 import sys
+import time
+import threading
 import logging
 import subprocess
 import shlex
 from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+import json
+
+# orjson serializes the cached printer snapshot several times faster
+# than stdlib json; optional, like elsewhere in this project
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import atexit
 import base64
+import datetime
+import binascii
+import copy
+import heapq
+import itertools
+import shutil
 import tempfile
+import collections
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+# Platform print backends; each is None on the platforms (or installs)
+# that lack it, so hot paths check a name instead of re-importing
+try:
+    import cups
+except ImportError:
+    cups = None
+try:
+    import win32print
+except ImportError:
+    win32print = None
+try:
+    import win32api
+except ImportError:
+    win32api = None
 
 logger = logging.getLogger(__name__)
 
+# Printer-state lookup tables, built once at import so the parsers on
+# the enumeration hot path are a dict get / short scan instead of a
+# rebuilt dict or a ten-branch cascade per call
+# Base64 payloads above this size are decoded straight to a spool file
+# in chunks instead of materializing the full decoded buffer in RAM
+_B64_STREAM_THRESHOLD = 8 * 1024 * 1024  # chars of base64 (~6MB decoded)
+
+
+def _decode_b64_to_file(b64_str: str, fh, chunk: int = 3 * 1024 * 1024):
+    """Decode a base64 string into an open binary file in fixed chunks
+
+    chunk is kept a multiple of 4 so every slice is independently
+    decodable; peak memory is O(chunk) instead of O(payload).
+    """
+    b64_str = ''.join(b64_str.split())  # strip any line breaks/whitespace
+    for start in range(0, len(b64_str), chunk):
+        fh.write(binascii.a2b_base64(b64_str[start:start + chunk]))
+
+
+@dataclass(frozen=True)
+class PrinterTable:
+    """Immutable printer-list snapshot
+
+    Holds the API rows plus a names column and a name->index map, so
+    name lookups are O(1) and names-only consumers iterate one
+    contiguous list instead of walking every row dict. Swapped as a
+    whole, so readers always see a coherent list/index pair.
+    """
+    rows: List[Dict] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    by_name: Dict[str, int] = field(default_factory=dict)
+    
+    @classmethod
+    def build(cls, rows: List[Dict]) -> 'PrinterTable':
+        names = [row['name'] for row in rows]
+        return cls(rows=rows, names=names,
+                   by_name={name: i for i, name in enumerate(names)})
+
+
+# Extension -> spool file type, resolved with one splitext/lower pass
+_EXT_TO_TYPE = {
+    '.txt': 'txt',
+    '.pdf': 'pdf',
+    '.ps': 'ps',
+    '.pcl': 'pcl',
+}
+
+def _sniff_file_type(data: bytes) -> Optional[str]:
+    """Identify PDF/PS/PCL payloads by their magic bytes
+
+    Returns None when the signature is unrecognized and the caller
+    should trust the filename extension.
+    """
+    if data.startswith(b'%PDF-'):
+        return 'pdf'
+    if data.startswith(b'%!PS'):
+        return 'ps'
+    if data.startswith(b'\x1b%-1') or data.startswith(b'\x1bE'):
+        return 'pcl'
+    return None
+
+
+_CUPS_STATES = {
+    3: 'idle',
+    4: 'printing',
+    5: 'stopped',
+}
+
+class _TempReaper:
+    """One background thread running all deferred spool-file cleanups
+
+    A Timer per print job means one OS thread (and GIL contender) per
+    job under load; here entries sit in a heap and a single daemon
+    thread sleeps until the earliest expiry is due.
+    """
+    
+    def __init__(self):
+        self._heap = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._thread = None
+    
+    def schedule(self, delay: float, callback):
+        """Run callback() after delay seconds on the reaper thread"""
+        with self._cond:
+            heapq.heappush(self._heap,
+                           (time.monotonic() + delay, next(self._seq), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name='temp-reaper')
+                self._thread.start()
+            self._cond.notify()
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                expiry, _, callback = self._heap[0]
+                wait = expiry - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                heapq.heappop(self._heap)
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"Deferred cleanup failed: {e}")
+    
+    def drain(self):
+        """Run everything immediately (at exit, so no spool files leak)"""
+        with self._cond:
+            entries, self._heap = self._heap, []
+        for _, _, callback in entries:
+            try:
+                callback()
+            except Exception:
+                pass
+
+
+_temp_reaper = _TempReaper()
+atexit.register(_temp_reaper.drain)
+
+
+# Test-page layout, formatted once per print instead of rebuilt as an
+# f-string (and without the per-call __import__ of datetime)
+_TEST_PAGE_TMPL = """
+╔══════════════════════════════════════════════════════════════╗
+║               AITS PRINT SERVER - TEST PAGE                  ║
+╠══════════════════════════════════════════════════════════════╣
+║                                                              ║
+║  Printer: {printer:<48} ║
+║  Server:  AITS Print Server                                  ║
+║  Date:    {date:<48} ║
+║                                                              ║
+║  If you can read this, the printer is working correctly!     ║
+║                                                              ║
+╠══════════════════════════════════════════════════════════════╣
+║             https://www.actief-it.be                         ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+
+# The frame around the template's two variable lines never changes, so
+# it is encoded once at import; print_test_page only formats and encodes
+# the Printer/Date block per call
+_TP_SPLIT_A = _TEST_PAGE_TMPL.index('║  Printer:')
+_TP_SPLIT_B = _TEST_PAGE_TMPL.index('\n', _TEST_PAGE_TMPL.index('{date:<48}')) + 1
+_TP_HEADER = _TEST_PAGE_TMPL[:_TP_SPLIT_A].encode('utf-8')
+_TP_MIDDLE_TMPL = _TEST_PAGE_TMPL[_TP_SPLIT_A:_TP_SPLIT_B]
+_TP_FOOTER = _TEST_PAGE_TMPL[_TP_SPLIT_B:].encode('utf-8')
+
+# PDF string-literal escapes for the hand-built text-to-PDF writer
+_PDF_ESCAPE = str.maketrans({'\\': r'\\', '(': r'\(', ')': r'\)', '\r': ''})
+
+# Characters CUPS rejects in queue names, folded to underscores in one
+# translate pass
+_CUPS_NAME_TRANS = str.maketrans({' ': '_', '/': '_', '\\': '_', '#': '_'})
+
+# PPD keywords surfaced through get_printer_options, with the keys they
+# fill in the result dict (choices_key None = default value only)
+_PPD_WANTED_OPTIONS = (
+    ('PageSize', 'paper_size', 'paper_sizes'),
+    ('Duplex', 'duplex', 'duplex_options'),
+    ('ColorModel', 'color_mode', 'color_modes'),
+    ('Orientation', 'orientation', None),
+    ('Resolution', 'resolution', 'resolutions'),
+    ('MediaType', 'media_type', 'media_types'),
+)
+
+_WIN32_STATUS_TABLE = (
+    (0x00000001, 'paused'),
+    (0x00000002, 'error'),
+    (0x00000004, 'pending_deletion'),
+    (0x00000008, 'paper_jam'),
+    (0x00000010, 'paper_out'),
+    (0x00000020, 'manual_feed'),
+    (0x00000040, 'paper_problem'),
+    (0x00000080, 'offline'),
+    (0x00000200, 'busy'),
+    (0x00000400, 'printing'),
+)
+
 
 class PrinterManager:
     """Manages printer discovery and communication"""
@@ -26,6 +244,50 @@ class PrinterManager:
         self.win32print = None
         self.backend_available = False
         
+        # Printer-list TTL cache: spooler/CUPS enumeration is an RPC per
+        # call (and can stall for seconds on flaky remotes), so serve a
+        # recent snapshot instead of re-enumerating on every request
+        self._printer_table: Optional[PrinterTable] = None
+        self._printer_cache_ts = 0.0
+        # (table, serialized JSON body) pair for get_printers_wire
+        self._printer_wire: Optional[tuple] = None
+        self._printer_cache_lock = threading.Lock()
+        self.printer_cache_ttl = self.config.get('printer_cache_ttl', 120)
+        # Last successful CUPS enumeration, served when a fresh one
+        # times out on an unreachable remote
+        self._cups_last_good: List[Dict] = []
+        # Set when the last enumeration came from a timeout/error path;
+        # such snapshots are cached only briefly so the next call retries
+        self._enum_failed = False
+        # Parsed PPD options per printer; PPDs rarely change, so avoid
+        # re-downloading and re-parsing them on every options request
+        self._ppd_cache: Dict[str, tuple] = {}
+        # Cached document-format-supported checks per printer
+        self._format_cache: Dict[str, tuple] = {}
+        # Ring of reusable spool files: overwriting a pooled path costs
+        # one truncate instead of the create+unlink directory churn of a
+        # fresh temp file per job
+        self.temp_file_pool = self.config.get('temp_file_pool', True)
+        self._tmp_ring = collections.deque()
+        self._tmp_ring_lock = threading.Lock()
+        # Spool files never need to survive a crash, so tmpfs is the
+        # right home for them when the system provides one
+        self._spool_dir = ('/dev/shm' if os.path.isdir('/dev/shm')
+                           and os.access('/dev/shm', os.W_OK) else None)
+        
+        # Long-lived PowerShell child for the Windows fallback path: the
+        # runspace startup (~250ms-seconds) is paid once instead of per
+        # discovery call
+        self._ps_proc = None
+        self._ps_lock = threading.Lock()
+        self._ps_exe = None
+        self._pdf_printer_exe = {}
+        self._default_printer = None
+        self._cups_version = None
+        # Serializes CUPS reconnects (cups.Connection is not thread-safe
+        # to recreate concurrently)
+        self._cups_lock = threading.Lock()
+        
         # Initialize platform-specific backend
         if self.platform.startswith('linux'):
             self._init_cups()
@@ -36,36 +298,154 @@ class PrinterManager:
     
     def _init_cups(self):
         """Initialize CUPS backend for Linux"""
+        if cups is None:
+            logger.warning("python-cups not installed. Printer features will be limited. Install with: pip install pycups")
+            self.backend_available = False
+            return
         try:
-            import cups
             self.cups_conn = cups.Connection()
             self.backend_available = True
             logger.info("CUPS backend initialized")
-        except ImportError:
-            logger.warning("python-cups not installed. Printer features will be limited. Install with: pip install pycups")
-            self.backend_available = False
         except Exception as e:
             logger.warning(f"Failed to connect to CUPS: {e}. Printer features will be limited.")
             self.backend_available = False
     
+    # Known install locations of silent-print-capable PDF viewers,
+    # probed once at init instead of stat()ing every path per print
+    _PDF_VIEWER_PATHS = {
+        'sumatra': [
+            r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
+            r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe",
+            r"%LOCALAPPDATA%\SumatraPDF\SumatraPDF.exe",
+        ],
+        'foxit': [
+            r"C:\Program Files\Foxit Software\Foxit PDF Reader\FoxitPDFReader.exe",
+            r"C:\Program Files (x86)\Foxit Software\Foxit PDF Reader\FoxitPDFReader.exe",
+            r"C:\Program Files\Foxit Software\Foxit Reader\FoxitReader.exe",
+            r"C:\Program Files (x86)\Foxit Software\Foxit Reader\FoxitReader.exe",
+        ],
+        'adobe': [
+            r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+            r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+            r"C:\Program Files\Adobe\Reader 11.0\Reader\AcroRd32.exe",
+            r"C:\Program Files (x86)\Adobe\Reader 11.0\Reader\AcroRd32.exe",
+            r"C:\Program Files\Adobe\Acrobat DC\Acrobat\Acrobat.exe",
+            r"C:\Program Files (x86)\Adobe\Acrobat DC\Acrobat\Acrobat.exe",
+        ],
+    }
+    
+    def _probe_pdf_viewers(self):
+        """Locate installed PDF viewers once; print time is a dict get"""
+        self._pdf_printer_exe = {
+            vendor: next(
+                (p for path in paths
+                 if os.path.exists(p := os.path.expandvars(path))),
+                None)
+            for vendor, paths in self._PDF_VIEWER_PATHS.items()
+        }
+    
     def _init_win32(self):
         """Initialize Win32 backend for Windows"""
-        try:
-            import win32print
+        self._probe_pdf_viewers()
+        if win32print is None:
+            logger.warning("pywin32 not installed. Printer features will be limited. Install with: pip install pywin32")
+            self.backend_available = False
+        else:
             self.win32print = win32print
             self.backend_available = True
             logger.info("Win32 print backend initialized")
-        except ImportError:
-            logger.warning("pywin32 not installed. Printer features will be limited. Install with: pip install pywin32")
-            self.backend_available = False
+            
+            # Spooler RPCs can hang on flaky network printers, so a
+            # daemon thread refreshes the list in the background and
+            # request threads only ever read the latest snapshot
+            self._win32_snapshot: List[Dict] = []
+            self._win32_ready = threading.Event()
+            self._win32_wake = threading.Event()
+            threading.Thread(target=self._win32_refresh_loop, daemon=True,
+                             name='win32-printer-refresh').start()
+    
+    def _win32_refresh_loop(self):
+        """Periodically re-enumerate Win32 printers into the snapshot"""
+        while True:
+            try:
+                # Plain attribute assignment is atomic, so readers always
+                # see either the old or the new complete list
+                self._win32_snapshot = self._get_printers_win32()
+            except Exception as e:
+                logger.error(f"Win32 printer refresh failed: {e}")
+            self._win32_ready.set()
+            self._win32_wake.wait(timeout=self.printer_cache_ttl)
+            self._win32_wake.clear()
+    
+    def refresh_now(self):
+        """Wake the background refresher for an immediate re-enumeration"""
+        if self.platform == 'win32' and self.backend_available:
+            self._win32_wake.set()
     
     def get_printers(self) -> List[Dict]:
-        """Get list of all available printers"""
+        """Get list of all available printers (served from a TTL cache)"""
+        return self._printer_table_fresh().rows
+    
+    def get_printer_names(self) -> List[str]:
+        """Names of all available printers (no row dicts touched)"""
+        return self._printer_table_fresh().names
+    
+    def get_printers_wire(self) -> bytes:
+        """Printer list as a ready-to-send JSON body
+
+        Serialized once per snapshot and handed to the HTTP layer
+        verbatim, so repeated /printers hits cost a bytes copy instead
+        of re-encoding N dicts per request.
+        """
+        table = self._printer_table_fresh()
+        with self._printer_cache_lock:
+            if self._printer_wire is None or self._printer_wire[0] is not table:
+                payload = {'success': True, 'printers': table.rows}
+                if orjson is not None:
+                    body = orjson.dumps(payload)
+                else:
+                    body = json.dumps(payload).encode()
+                self._printer_wire = (table, body)
+            return self._printer_wire[1]
+    
+    # How long a snapshot from a failed enumeration is served before
+    # retrying; long enough to ride out a burst of requests, short
+    # enough that a recovered cupsd is picked up promptly instead of
+    # advertising a stale (possibly empty) list for the full TTL
+    _FAILED_ENUM_TTL = 2.0
+
+    def _printer_table_fresh(self) -> PrinterTable:
+        """Return the cached snapshot, refreshing it past the TTL"""
+        with self._printer_cache_lock:
+            ttl = self._FAILED_ENUM_TTL if self._enum_failed else self.printer_cache_ttl
+            if (self._printer_table is not None
+                    and time.monotonic() - self._printer_cache_ts < ttl):
+                return self._printer_table
+
+        table = PrinterTable.build(self._enumerate_printers())
+
+        with self._printer_cache_lock:
+            self._printer_table = table
+            self._printer_cache_ts = time.monotonic()
+        return table
+    
+    def invalidate_printers(self):
+        """Drop the cached printer list (e.g. after a 'not found' error)"""
+        with self._printer_cache_lock:
+            self._printer_table = None
+            self._printer_cache_ts = 0.0
+        self.refresh_now()
+    
+    def _enumerate_printers(self) -> List[Dict]:
+        """Enumerate printers from the platform backend (uncached)"""
         if self.backend_available:
             if self.platform.startswith('linux'):
                 return self._get_printers_cups()
             elif self.platform == 'win32':
-                return self._get_printers_win32()
+                # Serve the refresher's snapshot; block only while the
+                # very first enumeration is still in flight
+                self._win32_ready.wait(timeout=2)
+                return list(self._win32_snapshot)
         
         # Fallback: use command line tools
         logger.info("Using fallback printer detection via command line")
@@ -93,44 +473,45 @@ class PrinterManager:
                 logger.warning(f"lpstat failed: {result.stderr}")
                 return []
             
+            by_name = {}
             default_printer = None
             
-            for line in result.stdout.strip().split('\n'):
+            for line in result.stdout.split('\n'):
                 line = line.strip()
                 if not line:
                     continue
-                    
+
+                # Lowercase once per line; every state test below reuses it
+                line_l = line.lower()
+
                 # Parse "printer HP-LaserJet is idle." or similar
-                if line.startswith('printer '):
+                if line_l.startswith('printer '):
                     parts = line.split()
                     if len(parts) >= 2:
-                        name = parts[1]
-                        state = 'ready'
-                        if 'disabled' in line.lower():
-                            state = 'offline'
-                        elif 'idle' in line.lower():
-                            state = 'idle'
-                        elif 'printing' in line.lower():
-                            state = 'printing'
-                        
-                        printers.append({
-                            'name': name,
+                        disabled = 'disabled' in line_l
+                        state = ('offline' if disabled else
+                                 'idle' if 'idle' in line_l else
+                                 'printing' if 'printing' in line_l else
+                                 'ready')
+
+                        by_name[parts[1]] = {
+                            'name': parts[1],
                             'description': '',
                             'location': '',
                             'model': '',
                             'state': state,
-                            'accepting_jobs': 'disabled' not in line.lower(),
+                            'accepting_jobs': not disabled,
                             'is_default': False
-                        })
-                
+                        }
+
                 # Parse "system default destination: HP-LaserJet"
-                elif line.startswith('system default destination:'):
-                    default_printer = line.split(':')[1].strip()
+                elif line_l.startswith('system default destination:'):
+                    default_printer = line.partition(':')[2].strip()
             
-            # Mark default printer
-            for printer in printers:
-                if printer['name'] == default_printer:
-                    printer['is_default'] = True
+            # Mark default printer with one lookup instead of a rescan
+            if default_printer in by_name:
+                by_name[default_printer]['is_default'] = True
+            printers = list(by_name.values())
             
             logger.info(f"Found {len(printers)} printer(s) via lpstat")
             return printers
@@ -145,25 +526,94 @@ class PrinterManager:
             logger.error(f"Error running lpstat: {e}")
             return []
     
+    _PS_SENTINEL = '__AITS_END__'
+    
+    def _ps_executable(self) -> str:
+        """Resolve the PowerShell binary once and cache it
+
+        PowerShell 7 (pwsh) starts noticeably faster than Windows
+        PowerShell, so prefer it when installed.
+        """
+        if self._ps_exe is None:
+            self._ps_exe = shutil.which('pwsh') or 'powershell'
+        return self._ps_exe
+    
+    def _ps_session(self):
+        """Return the persistent PowerShell child, starting it if needed"""
+        if self._ps_proc is None or self._ps_proc.poll() is not None:
+            self._ps_proc = subprocess.Popen(
+                [self._ps_executable(), '-NoProfile', '-NonInteractive', '-Command', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+        return self._ps_proc
+    
+    def _ps_run(self, ps_cmd: str, timeout: int = 30) -> Optional[str]:
+        """Run a command in the persistent session, sentinel-framed
+
+        Returns the command's stdout, or None when the session pipe is
+        broken (callers fall back to a one-shot invocation).
+        """
+        with self._ps_lock:
+            # readline() has no timeout of its own, so arm a timer that
+            # kills the child on expiry; the kill closes the pipe, the
+            # read loop raises, and the except branch resets the session
+            # so callers take the one-shot fallback.
+            watchdog = None
+            try:
+                proc = self._ps_session()
+                watchdog = threading.Timer(timeout, proc.kill)
+                watchdog.daemon = True
+                watchdog.start()
+                proc.stdin.write(f"{ps_cmd}\nWrite-Output '{self._PS_SENTINEL}'\n")
+                proc.stdin.flush()
+
+                lines = []
+                while True:
+                    line = proc.stdout.readline()
+                    if not line:  # pipe closed
+                        raise BrokenPipeError('PowerShell session ended')
+                    if line.strip() == self._PS_SENTINEL:
+                        return ''.join(lines)
+                    lines.append(line)
+            except Exception as e:
+                logger.warning(f"Persistent PowerShell session failed: {e}")
+                try:
+                    self._ps_proc.kill()
+                except Exception:
+                    pass
+                self._ps_proc = None
+                return None
+            finally:
+                if watchdog is not None:
+                    watchdog.cancel()
+    
     def _get_printers_powershell(self) -> List[Dict]:
         """Get printers using PowerShell (fallback for Windows without pywin32)"""
         printers = []
         try:
-            # Use PowerShell to get printers
-            ps_cmd = 'Get-Printer | Select-Object Name, DriverName, PortName, PrinterStatus, Default | ConvertTo-Json'
-            result = subprocess.run(
-                ['powershell', '-Command', ps_cmd],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # Use PowerShell to get printers; -Compress keeps the framed
+            # session output single-block
+            ps_cmd = 'Get-Printer | Select-Object Name, DriverName, PortName, PrinterStatus, Default | ConvertTo-Json -Compress'
             
-            if result.returncode != 0:
-                logger.warning(f"PowerShell failed: {result.stderr}")
-                return []
+            # Prefer the persistent session; one-shot only when it dies
+            output = self._ps_run(ps_cmd)
+            if output is None:
+                result = subprocess.run(
+                    [self._ps_executable(), '-NoProfile', '-NonInteractive', '-Command', ps_cmd],
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+                
+                if result.returncode != 0:
+                    logger.warning(f"PowerShell failed: {result.stderr}")
+                    return []
+                output = result.stdout
             
-            import json
-            data = json.loads(result.stdout)
+            data = json.loads(output)
             
             # Handle single printer (not a list)
             if isinstance(data, dict):
@@ -193,55 +643,107 @@ class PrinterManager:
             logger.error(f"Error running PowerShell: {e}")
             return []
     
+    def _cups_reconnect(self) -> bool:
+        """Re-establish the CUPS connection after cupsd dropped it"""
+        with self._cups_lock:
+            try:
+                self.cups_conn = cups.Connection()
+                logger.info("Reconnected to CUPS")
+                return True
+            except Exception as e:
+                logger.error(f"CUPS reconnect failed: {e}")
+                return False
+    
+    def _cups_call(self, method: str, *args, **kwargs):
+        """Invoke a Connection method, reconnecting once on failure
+
+        A cupsd restart poisons the persistent connection; rather than
+        paying a fresh ~1s handshake per call (or requiring a process
+        restart), retry the call once over a new connection.
+        """
+        try:
+            return getattr(self.cups_conn, method)(*args, **kwargs)
+        except Exception:
+            # cups.IPPError or RuntimeError when the socket died
+            if not self._cups_reconnect():
+                raise
+            return getattr(self.cups_conn, method)(*args, **kwargs)
+    
     def _get_printers_cups(self) -> List[Dict]:
-        """Get printers from CUPS"""
+        """Get printers from CUPS with a bounded wait
+
+        getPrinters() can stall for tens of seconds when a remote or
+        DNS-SD printer is unreachable, so the call runs in a worker and
+        is abandoned after a short timeout; the last good snapshot is
+        served instead so one broken remote never blocks the list.
+        """
         printers = []
         if not self.cups_conn:
             return printers
         try:
-            cups_printers = self.cups_conn.getPrinters()
+            timeout = self.config.get('cups_enum_timeout', 1.5)
+            executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                future = executor.submit(self._cups_call, 'getPrinters')
+                try:
+                    cups_printers = future.result(timeout=timeout)
+                except FutureTimeout:
+                    logger.warning(f"CUPS enumeration exceeded {timeout}s, serving last snapshot")
+                    self._enum_failed = True
+                    return list(self._cups_last_good)
+            finally:
+                # Don't wait for a hung getPrinters; the worker thread is
+                # abandoned and reaped when it eventually returns
+                executor.shutdown(wait=False)
             
+            # Bind the lookups once outside the loop; on a 50+ printer
+            # server the per-row attribute fetches add up
+            parse_state = self._parse_printer_state_cups
+            append = printers.append
             for name, info in cups_printers.items():
-                printers.append({
+                g = info.get
+                append({
                     'name': name,
-                    'description': info.get('printer-info', ''),
-                    'location': info.get('printer-location', ''),
-                    'model': info.get('printer-make-and-model', ''),
-                    'state': self._parse_printer_state_cups(info.get('printer-state', 3)),
-                    'accepting_jobs': info.get('printer-is-accepting-jobs', False),
-                    'uri': info.get('device-uri', '')
+                    'description': g('printer-info', ''),
+                    'location': g('printer-location', ''),
+                    'model': g('printer-make-and-model', ''),
+                    'state': parse_state(g('printer-state', 3)),
+                    'accepting_jobs': g('printer-is-accepting-jobs', False),
+                    'uri': g('device-uri', '')
                 })
             
             logger.info(f"Found {len(printers)} printer(s) via CUPS")
+            self._cups_last_good = printers
+            self._enum_failed = False
             return printers
-            
+
         except Exception as e:
             logger.error(f"Error getting CUPS printers: {e}", exc_info=True)
-            return []
+            self._enum_failed = True
+            return list(self._cups_last_good)
+    
+    def _win32_default_printer(self) -> Optional[str]:
+        """Memoized GetDefaultPrinter - the default changes rarely"""
+        if self._default_printer is None:
+            try:
+                self._default_printer = self.win32print.GetDefaultPrinter()
+            except:
+                return None
+        return self._default_printer
     
     def _get_printers_win32(self) -> List[Dict]:
         """Get printers from Windows"""
-        printers = []
         try:
-            # Get default printer
-            try:
-                default_printer = self.win32print.GetDefaultPrinter()
-            except:
-                default_printer = None
+            default_printer = self._win32_default_printer()
             
-            # Enumerate all printers
+            # Enumerate all printers. Level 2 returns the full
+            # PRINTER_INFO_2 records in this one spooler call, so no
+            # per-printer OpenPrinter/GetPrinter round trips are needed
             flags = self.win32print.PRINTER_ENUM_LOCAL | self.win32print.PRINTER_ENUM_CONNECTIONS
-            printer_list = self.win32print.EnumPrinters(flags)
-            
-            for printer_info in printer_list:
-                name = printer_info[2]
-                
-                try:
-                    # Get detailed printer info
-                    handle = self.win32print.OpenPrinter(name)
-                    properties = self.win32print.GetPrinter(handle, 2)
-                    self.win32print.ClosePrinter(handle)
-                    
+            printers = []
+            try:
+                for properties in self.win32print.EnumPrinters(flags, None, 2):
+                    name = properties.get('pPrinterName', '')
                     printers.append({
                         'name': name,
                         'description': properties.get('pComment', ''),
@@ -252,8 +754,19 @@ class PrinterManager:
                         'is_default': name == default_printer,
                         'port': properties.get('pPortName', '')
                     })
-                except Exception as e:
-                    logger.warning(f"Could not get details for printer {name}: {e}")
+            except Exception as e:
+                # Some remote queues refuse level-2 enumeration (access
+                # denied); fall back to per-printer probes in parallel
+                logger.warning(f"Level-2 printer enumeration failed ({e}), probing individually")
+                printers = []
+                printer_list = self.win32print.EnumPrinters(flags)
+                
+                if printer_list:
+                    with ThreadPoolExecutor(max_workers=min(16, len(printer_list))) as executor:
+                        for result in executor.map(self._win32_probe_one, printer_list):
+                            if result is not None:
+                                result['is_default'] = result['name'] == default_printer
+                                printers.append(result)
             
             logger.info(f"Found {len(printers)} printer(s) via Win32")
             return printers
@@ -262,13 +775,96 @@ class PrinterManager:
             logger.error(f"Error getting Win32 printers: {e}", exc_info=True)
             return []
     
+    def _win32_probe_one(self, printer_info) -> Optional[Dict]:
+        """Fetch level-2 details for one enumerated printer"""
+        name = printer_info[2]
+        try:
+            handle = self.win32print.OpenPrinter(name)
+            try:
+                properties = self.win32print.GetPrinter(handle, 2)
+            finally:
+                self.win32print.ClosePrinter(handle)
+            
+            return {
+                'name': name,
+                'description': properties.get('pComment', ''),
+                'location': properties.get('pLocation', ''),
+                'model': properties.get('pDriverName', ''),
+                'state': self._parse_printer_state_win32(properties.get('Status', 0)),
+                'accepting_jobs': properties.get('Status', 0) == 0,
+                'port': properties.get('pPortName', '')
+            }
+        except Exception as e:
+            logger.warning(f"Could not get details for printer {name}: {e}")
+            return None
+    
     def get_printer_info(self, printer_name: str) -> Optional[Dict]:
-        """Get detailed information about a specific printer"""
-        printers = self.get_printers()
-        for printer in printers:
-            if printer['name'] == printer_name:
-                return printer
-        return None
+        """Get detailed information about a specific printer
+
+        A fresh cache answers from the name index; a stale one triggers
+        a single-printer backend query instead of re-enumerating the
+        whole fleet just to read one record.
+        """
+        with self._printer_cache_lock:
+            table = self._printer_table
+            if (table is not None
+                    and time.monotonic() - self._printer_cache_ts < self.printer_cache_ttl):
+                index = table.by_name.get(printer_name)
+                return table.rows[index] if index is not None else None
+        
+        if self.backend_available:
+            try:
+                if self.platform.startswith('linux'):
+                    return self._get_printer_info_cups(printer_name)
+                elif self.platform == 'win32':
+                    return self._win32_probe_one((None, None, printer_name))
+            except Exception as e:
+                logger.debug(f"Single-printer query for {printer_name} failed: {e}")
+        
+        # Fallback: refresh the full list and index into it
+        table = self._printer_table_fresh()
+        index = table.by_name.get(printer_name)
+        return table.rows[index] if index is not None else None
+    
+    def _cups_accepts_text(self, printer_name: str) -> bool:
+        """Whether the queue advertises text/plain among its formats
+
+        Cached alongside the PPD options since document-format-supported
+        changes as rarely as the PPD does.
+        """
+        cached = self._format_cache.get(printer_name)
+        if cached and time.monotonic() - cached[0] < self.config.get('ppd_cache_ttl', 600):
+            return cached[1]
+        
+        try:
+            attrs = self._cups_call('getPrinterAttributes', printer_name)
+            accepts = 'text/plain' in attrs.get('document-format-supported', ())
+        except Exception as e:
+            logger.debug(f"Could not read supported formats for {printer_name}: {e}")
+            return False
+        
+        self._format_cache[printer_name] = (time.monotonic(), accepts)
+        return accepts
+    
+    # Only the attributes a printer row is built from; keeps the
+    # single-printer IPP response small
+    _CUPS_INFO_ATTRS = ['printer-info', 'printer-location',
+                        'printer-make-and-model', 'printer-state',
+                        'printer-is-accepting-jobs', 'device-uri']
+    
+    def _get_printer_info_cups(self, printer_name: str) -> Optional[Dict]:
+        """Fetch one printer's record via getPrinterAttributes"""
+        attrs = self._cups_call('getPrinterAttributes', printer_name,
+                                requested_attributes=self._CUPS_INFO_ATTRS)
+        return {
+            'name': printer_name,
+            'description': attrs.get('printer-info', ''),
+            'location': attrs.get('printer-location', ''),
+            'model': attrs.get('printer-make-and-model', ''),
+            'state': self._parse_printer_state_cups(attrs.get('printer-state', 3)),
+            'accepting_jobs': attrs.get('printer-is-accepting-jobs', False),
+            'uri': attrs.get('device-uri', '')
+        }
     
     def get_printer_options(self, printer_name: str) -> Dict:
         """Get default options/capabilities for a printer"""
@@ -279,54 +875,37 @@ class PrinterManager:
         return {}
     
     def _get_printer_options_cups(self, printer_name: str) -> Dict:
-        """Get printer options from CUPS PPD"""
+        """Get printer options from CUPS PPD (cached)
+
+        The PPD download is a network fetch on remote queues; parsed
+        options are cached for ppd_cache_ttl seconds (default 10 min).
+        """
+        cached = self._ppd_cache.get(printer_name)
+        if cached and time.monotonic() - cached[0] < self.config.get('ppd_cache_ttl', 600):
+            # Hand out a copy so callers can't mutate the cached dict
+            return copy.deepcopy(cached[1])
+        
         options = {}
         try:
-            import cups
-            
             # Get PPD (PostScript Printer Description) file
-            ppd_file = self.cups_conn.getPPD(printer_name)
+            ppd_file = self._cups_call('getPPD', printer_name)
             if ppd_file:
                 ppd = cups.PPD(ppd_file)
                 
-                # Get common options with their defaults
-                # Paper size
-                option = ppd.findOption('PageSize')
-                if option:
-                    options['paper_size'] = option.defchoice
-                    options['paper_sizes'] = [choice['choice'] for choice in option.choices]
+                # One walk over the option tree instead of a findOption
+                # scan per keyword
+                opts_by_kw = {o.keyword: o
+                              for g in ppd.optionGroups for o in g.options}
                 
-                # Duplex
-                option = ppd.findOption('Duplex')
-                if option:
-                    options['duplex'] = option.defchoice
-                    options['duplex_options'] = [choice['choice'] for choice in option.choices]
-                
-                # Color mode
-                option = ppd.findOption('ColorModel')
-                if option:
-                    options['color_mode'] = option.defchoice
-                    options['color_modes'] = [choice['choice'] for choice in option.choices]
-                
-                # Orientation (not always in PPD, might be application-level)
-                option = ppd.findOption('Orientation')
-                if option:
-                    options['orientation'] = option.defchoice
-                
-                # Resolution
-                option = ppd.findOption('Resolution')
-                if option:
-                    options['resolution'] = option.defchoice
-                    options['resolutions'] = [choice['choice'] for choice in option.choices]
-                
-                # Media type
-                option = ppd.findOption('MediaType')
-                if option:
-                    options['media_type'] = option.defchoice
-                    options['media_types'] = [choice['choice'] for choice in option.choices]
+                for keyword, def_key, choices_key in _PPD_WANTED_OPTIONS:
+                    option = opts_by_kw.get(keyword)
+                    if option:
+                        options[def_key] = option.defchoice
+                        if choices_key:
+                            options[choices_key] = [choice['choice']
+                                                    for choice in option.choices]
                 
                 # Clean up PPD file
-                import os
                 try:
                     os.unlink(ppd_file)
                 except:
@@ -334,8 +913,11 @@ class PrinterManager:
                     
         except Exception as e:
             logger.error(f"Error getting CUPS printer options for {printer_name}: {e}", exc_info=True)
+            # Don't cache a failed fetch; retry on the next call
+            return options
         
-        return options
+        self._ppd_cache[printer_name] = (time.monotonic(), options)
+        return copy.deepcopy(options)
     
     def _get_printer_options_win32(self, printer_name: str) -> Dict:
         """Get printer options from Windows"""
@@ -384,6 +966,135 @@ class PrinterManager:
         
         return options
     
+    def print_file(self, printer_name: str, file_path: str, document_name: str = None,
+                   copies: int = 1, options: dict = None) -> bool:
+        """Print a document that is already on disk
+
+        Skips the base64 round-trip of print_document: the file is handed
+        to the spooler by path, so nothing is re-encoded or re-buffered.
+        The caller keeps ownership of the file.
+        """
+        if document_name is None:
+            document_name = os.path.basename(file_path)
+        
+        if self.platform.startswith('linux'):
+            return self._print_cups_file(printer_name, file_path, document_name,
+                                         copies, options)
+        elif self.platform == 'win32':
+            return self._print_win32_file(printer_name, file_path, document_name,
+                                          copies, options)
+        
+        logger.error(f"Printing not supported on platform: {self.platform}")
+        return False
+
+    _TMP_RING_MAX = 8
+    
+    def _spool_write(self, data: bytes, suffix: str) -> str:
+        """Write data to a spool file, reusing a pooled path when enabled"""
+        path = None
+        if self.temp_file_pool:
+            with self._tmp_ring_lock:
+                for i in range(len(self._tmp_ring)):
+                    if self._tmp_ring[i].endswith(suffix):
+                        path = self._tmp_ring[i]
+                        del self._tmp_ring[i]
+                        break
+        
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix=suffix, prefix='aits-spool-',
+                                        dir=self._spool_dir)
+        else:
+            fd = os.open(path, os.O_WRONLY | os.O_TRUNC)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        return path
+    
+    def _spool_release(self, path: str, delay: int = 30):
+        """Hand a spool file back to the ring (or delete it) after a delay
+
+        The delay leaves the spooler time to finish reading before the
+        path can be truncated by the next job.
+        """
+        if not self.temp_file_pool:
+            self._cleanup_file_later(path, delay)
+            return
+        
+        def release():
+            with self._tmp_ring_lock:
+                if len(self._tmp_ring) < self._TMP_RING_MAX:
+                    self._tmp_ring.append(path)
+                    return
+            self._safe_unlink(path)
+        
+        _temp_reaper.schedule(delay, release)
+    
+    def _cleanup_file_later(self, path: str, delay: int = 60):
+        """Delete a spool file once the print system has had time to read it
+
+        Scheduled on the shared reaper so the printing thread never
+        blocks waiting for the spooler to release the file.
+        """
+        _temp_reaper.schedule(delay, lambda: self._safe_unlink(path))
+    
+    def _safe_unlink(self, path: str):
+        try:
+            if os.path.exists(path):
+                os.unlink(path)
+                logger.debug(f"Cleaned up temp file: {path}")
+        except Exception as e:
+            logger.warning(f"Could not delete temp file: {e}")
+    
+    def supports_streaming(self) -> bool:
+        """Whether print_stream can pipe a document to the spooler
+
+        Only the lp command accepts stdin; the Windows backends all need
+        an on-disk file.
+        """
+        return self.platform.startswith('linux')
+
+    def print_stream(self, printer_name: str, fileobj, document_name: str = 'document.pdf',
+                     copies: int = 1, options: dict = None) -> bool:
+        """Pipe a readable binary stream straight into lp's stdin
+
+        Avoids the temp-file round-trip entirely: the document goes from
+        the source stream to the spooler in 64KB chunks without touching
+        disk. Returns False when streaming is unsupported or lp fails;
+        callers should fall back to print_file / print_document_bytes.
+        """
+        if not self.supports_streaming():
+            return False
+
+        try:
+            # Mirror the lp fallback in _print_cups_file, minus the file
+            # argument so lp reads stdin
+            cmd = ['lp', '-d', printer_name]
+            if copies > 1:
+                cmd.extend(['-n', str(copies)])
+            if document_name:
+                cmd.extend(['-t', document_name])
+
+            logger.info(f"Streaming to: {' '.join(cmd)}")
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            try:
+                shutil.copyfileobj(fileobj, proc.stdin, 65536)
+            except BrokenPipeError:
+                pass  # lp exited early; its returncode tells the story
+
+            # communicate() flushes and closes stdin, then collects output
+            stdout, stderr = proc.communicate(timeout=60)
+            if proc.returncode == 0:
+                logger.info(f"lp stream succeeded: {stdout.decode(errors='replace').strip()}")
+                return True
+
+            logger.error(f"lp stream failed: {stderr.decode(errors='replace').strip()}")
+            return False
+        except Exception as e:
+            logger.error(f"Stream print error: {e}", exc_info=True)
+            return False
+
     def print_document(self, printer_name: str, document: str, document_name: str,
                       copies: int = 1, options: dict = None) -> bool:
         """
@@ -399,50 +1110,154 @@ class PrinterManager:
         Returns:
             True if successful, False otherwise
         """
+        # Large payloads stream-decode into a spool file so the decoded
+        # bytes never sit in memory alongside the base64 text; the txt
+        # conversion path always needs bytes, so it stays on the direct
+        # decode regardless of size
+        if (len(document) > _B64_STREAM_THRESHOLD
+                and not (document_name or '').lower().endswith('.txt')):
+            suffix = os.path.splitext(document_name or '')[1] or '.pdf'
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+            try:
+                _decode_b64_to_file(document, temp_file)
+                temp_file.close()
+                return self.print_file(printer_name, temp_file.name,
+                                       document_name, copies, options)
+            finally:
+                temp_file.close()
+                self._cleanup_file_later(temp_file.name)
+        
+        # Decode once here; everything below works on raw bytes
+        return self.print_document_bytes(printer_name, base64.b64decode(document),
+                                         document_name, copies, options)
+
+    def print_document_bytes(self, printer_name: str, data: bytes, document_name: str,
+                             copies: int = 1, options: dict = None) -> bool:
+        """Print a document given as raw bytes
+
+        Callers that already hold decoded bytes (or downloaded content)
+        should use this instead of print_document, which exists for the
+        base64 API payloads and just decodes into this method.
+        """
         if self.platform.startswith('linux'):
-            return self._print_cups(printer_name, document, document_name, copies, options)
+            success = self._print_cups(printer_name, data, document_name, copies, options)
         elif self.platform == 'win32':
-            return self._print_win32(printer_name, document, document_name, copies, options)
-    
-    def _print_cups(self, printer_name: str, document: str, document_name: str,
+            success = self._print_win32(printer_name, data, document_name, copies, options)
+        else:
+            logger.error(f"Printing not supported on platform: {self.platform}")
+            return False
+        
+        if not success:
+            # A failed print may mean the queue was reconfigured; force a
+            # fresh PPD fetch for this printer on the next options call,
+            # and re-query the default printer
+            self._ppd_cache.pop(printer_name, None)
+            self._default_printer = None
+        return success
+
+    def _print_cups(self, printer_name: str, document_data: bytes, document_name: str,
                     copies: int, options: dict) -> bool:
         """Print using CUPS"""
-        import time
-        import os
-        
-        temp_file = None
+        temp_path = None
         try:
-            # Decode base64 document
-            document_data = base64.b64decode(document)
-            
-            # Determine file type from document name
-            file_type = 'pdf'  # default
-            if document_name:
-                if document_name.lower().endswith('.txt'):
-                    file_type = 'txt'
-                elif document_name.lower().endswith('.pdf'):
-                    file_type = 'pdf'
-                elif document_name.lower().endswith('.ps'):
-                    file_type = 'ps'
-                elif document_name.lower().endswith('.pcl'):
-                    file_type = 'pcl'
+
+            # Determine file type: trust the payload's magic bytes over
+            # the filename, so a PDF arriving under a .txt name never
+            # takes the expensive reportlab conversion detour
+            file_type = _sniff_file_type(document_data[:8])
+            if file_type is None:
+                ext = os.path.splitext(document_name or '')[1].lower()
+                file_type = _EXT_TO_TYPE.get(ext, 'pdf')
             
-            # Convert text to PDF if needed
-            if file_type == 'txt':
+            # Convert text to PDF if needed. When the queue accepts
+            # text/plain, CUPS' own texttopdf filter (C code) does this
+            # conversion faster than reportlab ever will, so hand the
+            # text over untouched
+            if file_type == 'txt' and not (self.cups_conn and self._cups_accepts_text(printer_name)):
                 logger.info(f"Converting text file to PDF for better printer compatibility")
                 document_data = self._convert_text_to_pdf(document_data, document_name)
                 file_type = 'pdf'
             
-            # Create temporary file
-            suffix = f'.{file_type}'
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-            temp_file.write(document_data)
-            temp_file.flush()
-            os.fsync(temp_file.fileno())  # Ensure data is written to disk
-            temp_file.close()
+            # Stream straight to cupsd when the library binds the
+            # incremental job APIs: no temp file, no fsync and none of
+            # the "give CUPS time to read it" sleeps
+            if self.cups_conn and self._cups_can_stream():
+                return self._print_cups_data(printer_name, document_data,
+                                             document_name, file_type,
+                                             copies, options)
             
-            logger.info(f"Created temp file {temp_file.name} ({len(document_data)} bytes) for printing")
+            # Write the spool file. No flush/fsync: the file is read
+            # back immediately by another local process and never needs
+            # to survive a crash, so a disk barrier buys nothing
+            temp_path = self._spool_write(document_data, f'.{file_type}')
             
+            logger.info(f"Created spool file {temp_path} ({len(document_data)} bytes) for printing")
+            
+            return self._print_cups_file(printer_name, temp_path,
+                                         document_name, copies, options)
+                        
+        except Exception as e:
+            logger.error(f"CUPS print error: {e}", exc_info=True)
+            return False
+        
+        finally:
+            # Release after a delay (without blocking this job) so CUPS
+            # has time to read the file
+            if temp_path:
+                self._spool_release(temp_path, delay=30)
+    
+    _CUPS_MIME_TYPES = {
+        'pdf': 'application/pdf',
+        'ps': 'application/postscript',
+        'pcl': 'application/vnd.hp-pcl',
+        'txt': 'text/plain',
+    }
+    
+    def _cups_can_stream(self) -> bool:
+        """Whether pycups binds the incremental document-submission APIs"""
+        return all(hasattr(self.cups_conn, attr) for attr in
+                   ('createJob', 'startDocument', 'writeRequestData', 'finishDocument'))
+    
+    def _print_cups_data(self, printer_name: str, document_data: bytes,
+                         document_name: str, file_type: str,
+                         copies: int, options: dict) -> bool:
+        """Submit document bytes directly to cupsd, bypassing disk"""
+        cups_options = self._build_cups_options(copies, options)
+        mime_type = self._CUPS_MIME_TYPES.get(file_type, 'application/octet-stream')
+        
+        logger.info(f"Streaming {document_name} ({len(document_data)} bytes) to {printer_name} "
+                    f"with options: {cups_options}")
+        
+        # Only createJob goes through the reconnect wrapper: once the
+        # incremental submission has started it must stay on one socket
+        job_id = self._cups_call('createJob', printer_name, document_name, cups_options)
+        self.cups_conn.startDocument(printer_name, job_id, document_name, mime_type, 1)
+        # memoryview avoids a document-size copy inside the binding
+        self.cups_conn.writeRequestData(memoryview(document_data), len(document_data))
+        self.cups_conn.finishDocument(printer_name)
+        
+        logger.info(f"CUPS job {job_id} submitted to {printer_name}")
+        return True
+    
+    def _build_cups_options(self, copies: int, options: dict) -> Dict[str, str]:
+        """Convert API options to the string map CUPS expects"""
+        cups_options = {}
+        if options:
+            for key, value in options.items():
+                if isinstance(value, bool):
+                    # Convert boolean to CUPS format
+                    cups_options[key] = 'true' if value else 'false'
+                else:
+                    cups_options[key] = str(value)
+        # Set copies option - CUPS requires string value
+        if copies > 1:
+            cups_options['copies'] = str(copies)
+        return cups_options
+    
+    def _print_cups_file(self, printer_name: str, file_path: str, document_name: str,
+                         copies: int, options: dict) -> bool:
+        """Print an on-disk file via CUPS (library or lp fallback)"""
+        try:
             # Prepare print options
             # CUPS can accept both 'copies' option or via printFile API
             cups_options = {}
@@ -467,18 +1282,13 @@ class PrinterManager:
                     cups_options['copies'] = str(copies)
                 
                 # Submit print job via CUPS library
-                job_id = self.cups_conn.printFile(
-                    printer_name,
-                    temp_file.name,
-                    document_name,
-                    cups_options
-                )
+                job_id = self._cups_call('printFile', printer_name, file_path,
+                                         document_name, cups_options)
                 
                 logger.info(f"CUPS job {job_id} submitted to {printer_name}")
                 
-                # Give CUPS time to read the file before we delete it
-                time.sleep(1)
-                
+                # printFile returns once cupsd has taken the data, so
+                # there is nothing to sleep for before verification
                 # Verify job was accepted
                 try:
                     jobs = self.cups_conn.getJobs(which_jobs='not-completed')
@@ -507,7 +1317,7 @@ class PrinterManager:
                     cmd.extend(['-t', document_name])
                 
                 # Add the file to print
-                cmd.append(temp_file.name)
+                cmd.append(file_path)
                 
                 logger.info(f"Running: {' '.join(cmd)}")
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
@@ -517,30 +1327,76 @@ class PrinterManager:
                 else:
                     logger.error(f"lp command failed: {result.stderr.strip()}")
                     return False
-                
-                # Give CUPS time to process
-                time.sleep(1)
             
             return True
                         
         except Exception as e:
             logger.error(f"CUPS print error: {e}", exc_info=True)
             return False
+    
+    def _text_to_pdf_fast(self, text_data: bytes) -> bytes:
+        """Assemble a Courier-10 PDF by hand - no reportlab on the hot path
+
+        Monospaced plain text only needs one text object per page, so the
+        whole document is a handful of joined operator strings plus a
+        hand-built xref table.
+        """
+        try:
+            text = text_data.decode('utf-8')
+        except UnicodeDecodeError:
+            text = text_data.decode('latin-1', errors='ignore')
         
-        finally:
-            # Clean up temporary file after delay
-            if temp_file:
-                try:
-                    # Delete after a delay to ensure CUPS has read it
-                    time.sleep(0.5)
-                    if os.path.exists(temp_file.name):
-                        os.unlink(temp_file.name)
-                        logger.debug(f"Cleaned up temp file {temp_file.name}")
-                except Exception as e:
-                    logger.warning(f"Could not delete temp file: {e}")
+        # One C-level translate sweep over the whole body, then split;
+        # no per-line fixup needed
+        lines = text.translate(_PDF_ESCAPE).split('\n')
+        
+        # A4 at 12pt leading between 54pt margins
+        per_page = 61
+        pages = [lines[i:i + per_page] for i in range(0, len(lines), per_page)] or [['']]
+        
+        # Objects: 1 catalog, 2 pages, 3 font, then page/content pairs
+        objs = [
+            b'<< /Type /Catalog /Pages 2 0 R >>',
+            None,  # pages node, filled in below
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>',
+        ]
+        page_ids = [4 + 2 * i for i in range(len(pages))]
+        kids = ' '.join(f'{n} 0 R' for n in page_ids)
+        objs[1] = f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>'.encode()
+        
+        for page_id, page_lines in zip(page_ids, pages):
+            content = ('BT /F1 10 Tf 12 TL 54 788 Td\n'
+                       + ' T* '.join(f'({line}) Tj' for line in page_lines)
+                       + '\nET').encode('latin-1', 'replace')
+            objs.append(
+                f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                f'/Resources << /Font << /F1 3 0 R >> >> '
+                f'/Contents {page_id + 1} 0 R >>'.encode())
+            objs.append(b'<< /Length %d >>\nstream\n%s\nendstream'
+                        % (len(content), content))
+        
+        out = bytearray(b'%PDF-1.4\n')
+        offsets = []
+        for num, body in enumerate(objs, start=1):
+            offsets.append(len(out))
+            out += b'%d 0 obj\n' % num + body + b'\nendobj\n'
+        xref_pos = len(out)
+        out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objs) + 1)
+        for off in offsets:
+            out += b'%010d 00000 n \n' % off
+        out += (b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                % (len(objs) + 1, xref_pos))
+        return bytes(out)
     
     def _convert_text_to_pdf(self, text_data: bytes, document_name: str = "document") -> bytes:
-        """Convert plain text to PDF using reportlab"""
+        """Convert plain text to PDF"""
+        try:
+            pdf_data = self._text_to_pdf_fast(text_data)
+            logger.info(f"Converted text to PDF ({len(pdf_data)} bytes)")
+            return pdf_data
+        except Exception as e:
+            logger.warning(f"Fast text-to-PDF failed ({e}), falling back to reportlab")
+        
         try:
             from reportlab.lib.pagesizes import letter, A4
             from reportlab.lib.units import inch
@@ -569,17 +1425,27 @@ class PrinterManager:
             y = height - margin
             line_height = 12  # points
             
-            # Write text to PDF
+            # Write text to PDF. One text object per page: each
+            # drawString call would emit its own BT/Tf/Td/ET block to
+            # the content stream, while textLine inside a single object
+            # is just a string show plus a T* line advance
+            text_obj = c.beginText(margin, y)
+            text_obj.setFont("Courier", 10)
+            text_obj.setLeading(line_height)
             for line in lines:
                 # Check if we need a new page
                 if y < margin:
+                    c.drawText(text_obj)
                     c.showPage()
-                    c.setFont("Courier", 10)
                     y = height - margin
+                    text_obj = c.beginText(margin, y)
+                    text_obj.setFont("Courier", 10)
+                    text_obj.setLeading(line_height)
                 
                 # Write line
-                c.drawString(margin, y, line)
+                text_obj.textLine(line)
                 y -= line_height
+            c.drawText(text_obj)
             
             # Save PDF
             c.save()
@@ -600,39 +1466,60 @@ class PrinterManager:
             return text_data
     
     
-    def _print_win32(self, printer_name: str, document: str, document_name: str,
+    def _print_win32(self, printer_name: str, document_data: bytes, document_name: str,
                      copies: int, options: dict) -> bool:
         """Print using Win32 - tries multiple methods"""
+        # RAW-capable drivers take the decoded bytes directly; no spool
+        # file round-trip needed. Only when the payload is in a language
+        # the driver actually speaks - a PCL queue fed raw PDF prints
+        # pages of garbage while reporting success
+        payload_type = _sniff_file_type(document_data[:8])
+        if self._win32_supports_raw(printer_name, payload_type):
+            if self._print_win32_raw_bytes(printer_name, document_data,
+                                           document_name, copies):
+                return True
+        
+        temp_path = None
         try:
-            # Decode base64 document
-            document_data = base64.b64decode(document)
+            # Write the spool file
+            temp_path = self._spool_write(document_data, '.pdf')
             
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-            temp_file.write(document_data)
-            temp_file.close()
-            temp_path = temp_file.name
-            
-            logger.info(f"Created temp file: {temp_path} ({len(document_data)} bytes)")
+            logger.info(f"Created spool file: {temp_path} ({len(document_data)} bytes)")
             
+            return self._print_win32_file(printer_name, temp_path, document_name,
+                                          copies, options)
+                
+        except Exception as e:
+            logger.error(f"Win32 print error: {e}", exc_info=True)
+            return False
+        finally:
+            # Release after some time to let the spooler finish reading
+            if temp_path:
+                self._spool_release(temp_path, delay=60)
+    
+    def _print_win32_file(self, printer_name: str, temp_path: str, document_name: str,
+                          copies: int, options: dict) -> bool:
+        """Print an on-disk file on Windows - tries multiple methods.
+        The caller keeps ownership of the file."""
+        try:
             # Try multiple print methods
             success = False
             
+            # Method 0: go straight to the spooler when the driver
+            # speaks the payload's language — no viewer cold-start, the
+            # job lands in the queue in milliseconds
+            try:
+                with open(temp_path, 'rb') as f:
+                    payload_type = _sniff_file_type(f.read(8))
+            except OSError:
+                payload_type = None
+            if self._win32_supports_raw(printer_name, payload_type):
+                if self._print_win32_raw(printer_name, temp_path, document_name, copies):
+                    return True
+            
             # Method 1: Try using SumatraPDF (common silent PDF printer)
             try:
-                import subprocess
-                sumatra_paths = [
-                    r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
-                    r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe",
-                    os.path.expandvars(r"%LOCALAPPDATA%\SumatraPDF\SumatraPDF.exe"),
-                ]
-                
-                sumatra_exe = None
-                for path in sumatra_paths:
-                    if os.path.exists(path):
-                        sumatra_exe = path
-                        break
-                
+                sumatra_exe = self._pdf_printer_exe.get('sumatra')
                 if sumatra_exe:
                     logger.info(f"Using SumatraPDF: {sumatra_exe}")
                     # Build print settings string with copies
@@ -652,27 +1539,21 @@ class PrinterManager:
                         return True
                     else:
                         logger.warning(f"SumatraPDF returned: {result.returncode}")
+            except FileNotFoundError:
+                # Cached path went stale (viewer uninstalled) - re-probe
+                self._probe_pdf_viewers()
             except Exception as e:
                 logger.debug(f"SumatraPDF method failed: {e}")
             
             # Method 2: Try using Foxit Reader
             try:
-                import subprocess
-                foxit_paths = [
-                    r"C:\Program Files\Foxit Software\Foxit PDF Reader\FoxitPDFReader.exe",
-                    r"C:\Program Files (x86)\Foxit Software\Foxit PDF Reader\FoxitPDFReader.exe",
-                    r"C:\Program Files\Foxit Software\Foxit Reader\FoxitReader.exe",
-                    r"C:\Program Files (x86)\Foxit Software\Foxit Reader\FoxitReader.exe",
-                ]
-                
-                foxit_exe = None
-                for path in foxit_paths:
-                    if os.path.exists(path):
-                        foxit_exe = path
-                        break
-                
+                foxit_exe = self._pdf_printer_exe.get('foxit')
                 if foxit_exe:
                     logger.info(f"Using Foxit Reader: {foxit_exe}")
+                    # One spawn per copy: Foxit has no copies flag, and
+                    # setting dmCopies via SetPrinter would mutate the
+                    # system-wide printer default (and leave it mutated
+                    # if we die mid-print)
                     for _ in range(copies):
                         result = subprocess.run([
                             foxit_exe,
@@ -682,28 +1563,14 @@ class PrinterManager:
                     success = True
                     logger.info(f"Printed via Foxit Reader to {printer_name}")
                     return True
+            except FileNotFoundError:
+                self._probe_pdf_viewers()
             except Exception as e:
                 logger.debug(f"Foxit Reader method failed: {e}")
             
             # Method 3: Try using Adobe Reader
             try:
-                import subprocess
-                import time
-                adobe_paths = [
-                    r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
-                    r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
-                    r"C:\Program Files\Adobe\Reader 11.0\Reader\AcroRd32.exe",
-                    r"C:\Program Files (x86)\Adobe\Reader 11.0\Reader\AcroRd32.exe",
-                    r"C:\Program Files\Adobe\Acrobat DC\Acrobat\Acrobat.exe",
-                    r"C:\Program Files (x86)\Adobe\Acrobat DC\Acrobat\Acrobat.exe",
-                ]
-                
-                adobe_exe = None
-                for path in adobe_paths:
-                    if os.path.exists(path):
-                        adobe_exe = path
-                        break
-                
+                adobe_exe = self._pdf_printer_exe.get('adobe')
                 if adobe_exe:
                     logger.info(f"Using Adobe Reader: {adobe_exe}")
                     for _ in range(copies):
@@ -721,37 +1588,17 @@ class PrinterManager:
                     return True
             except subprocess.TimeoutExpired:
                 logger.warning("Adobe Reader print timed out")
+            except FileNotFoundError:
+                self._probe_pdf_viewers()
             except Exception as e:
                 logger.debug(f"Adobe Reader method failed: {e}")
             
             # Method 4: Try using win32print directly (RAW printing - for PCL/PostScript printers)
-            try:
-                import win32print
-                import win32con
-                
-                # This sends RAW PDF data - works on printers with PDF support
-                hprinter = win32print.OpenPrinter(printer_name)
-                try:
-                    job_info = win32print.StartDocPrinter(hprinter, 1, (document_name, None, "RAW"))
-                    try:
-                        win32print.StartPagePrinter(hprinter)
-                        for _ in range(copies):
-                            win32print.WritePrinter(hprinter, document_data)
-                        win32print.EndPagePrinter(hprinter)
-                    finally:
-                        win32print.EndDocPrinter(hprinter)
-                    success = True
-                    logger.info(f"Printed via win32print RAW to {printer_name}")
-                    return True
-                finally:
-                    win32print.ClosePrinter(hprinter)
-            except Exception as e:
-                logger.debug(f"win32print RAW method failed: {e}")
+            if self._print_win32_raw(printer_name, temp_path, document_name, copies):
+                return True
             
             # Method 5: Fallback to ShellExecute (original method)
             try:
-                import win32api
-                
                 logger.info(f"Trying ShellExecute print to {printer_name}")
                 win32api.ShellExecute(
                     0,
@@ -779,59 +1626,94 @@ class PrinterManager:
         except Exception as e:
             logger.error(f"Win32 print error: {e}", exc_info=True)
             return False
-        finally:
-            # Schedule temp file cleanup after some time to let spooler finish
-            if 'temp_path' in locals():
+    
+    # Driver-name fragments per payload language. PDF is deliberately
+    # absent: 'pdf' in a driver name is usually a virtual queue like
+    # "Microsoft Print to PDF", not a printer that interprets raw PDF,
+    # so PDF payloads go through the viewers first and only reach RAW
+    # as the existing last-resort method
+    # 'text' marks drivers that render plain cp437 text sent RAW: PCL
+    # devices print it directly, as does "Generic / Text Only". A
+    # PostScript interpreter would treat it as a (broken) program, and
+    # host-based/GDI drivers ignore it, so neither qualifies
+    _RAW_DRIVER_HINTS = {
+        'pcl': ('pcl',),
+        'ps': ('postscript', ' ps'),
+        'text': ('pcl', 'text only'),
+    }
+    
+    def _win32_supports_raw(self, printer_name: str,
+                            payload_type: Optional[str]) -> bool:
+        """Whether the driver natively speaks the sniffed payload type"""
+        hints = self._RAW_DRIVER_HINTS.get(payload_type)
+        if not hints:
+            return False
+        info = self.get_printer_info(printer_name)
+        if not info:
+            return False
+        model = (info.get('model') or '').lower()
+        return any(hint in model for hint in hints)
+    
+    def _print_win32_raw(self, printer_name: str, temp_path: str,
+                         document_name: str, copies: int) -> bool:
+        """Submit an on-disk file to the spooler as a RAW job"""
+        with open(temp_path, 'rb') as f:
+            document_data = f.read()
+        return self._print_win32_raw_bytes(printer_name, document_data,
+                                           document_name, copies)
+    
+    # Cap on the concatenated multi-copy RAW buffer
+    _RAW_BATCH_LIMIT = 64 * 1024 * 1024
+    
+    def _print_win32_raw_bytes(self, printer_name: str, document_data: bytes,
+                               document_name: str, copies: int) -> bool:
+        """Submit in-memory bytes straight to the spooler as a RAW job"""
+        if win32print is None:
+            return False
+        try:
+            # This sends RAW PDF data - works on printers with PDF support
+            # memoryview skips the re-copy pywin32 would otherwise make
+            mv = memoryview(document_data)
+            
+            hprinter = win32print.OpenPrinter(printer_name)
+            try:
+                win32print.StartDocPrinter(hprinter, 1, (document_name, None, "RAW"))
                 try:
-                    import threading
-                    def cleanup_temp():
-                        import time
-                        time.sleep(60)  # Wait 60 seconds for print spooler
-                        try:
-                            if os.path.exists(temp_path):
-                                os.unlink(temp_path)
-                                logger.debug(f"Cleaned up temp file: {temp_path}")
-                        except Exception:
-                            pass
-                    threading.Thread(target=cleanup_temp, daemon=True).start()
-                except Exception:
-                    pass
+                    win32print.StartPagePrinter(hprinter)
+                    if copies == 1:
+                        win32print.WritePrinter(hprinter, mv)
+                    elif len(document_data) * copies <= self._RAW_BATCH_LIMIT:
+                        # One spooler round-trip for all copies
+                        win32print.WritePrinter(hprinter, document_data * copies)
+                    else:
+                        # Too big to concatenate without doubling peak RSS;
+                        # stream 1 MiB slices instead
+                        for _ in range(copies):
+                            for off in range(0, len(mv), 1024 * 1024):
+                                win32print.WritePrinter(hprinter, mv[off:off + 1024 * 1024])
+                    win32print.EndPagePrinter(hprinter)
+                finally:
+                    win32print.EndDocPrinter(hprinter)
+                logger.info(f"Printed via win32print RAW to {printer_name}")
+                return True
+            finally:
+                win32print.ClosePrinter(hprinter)
+        except Exception as e:
+            logger.debug(f"win32print RAW method failed: {e}")
+            return False
     
     def _parse_printer_state_cups(self, state: int) -> str:
         """Parse CUPS printer state"""
-        states = {
-            3: 'idle',
-            4: 'printing',
-            5: 'stopped'
-        }
-        return states.get(state, 'unknown')
+        return _CUPS_STATES.get(state, 'unknown')
     
     def _parse_printer_state_win32(self, status: int) -> str:
-        """Parse Win32 printer status"""
+        """Parse Win32 printer status (lowest set bit wins)"""
         if status == 0:
             return 'ready'
-        elif status & 0x00000001:
-            return 'paused'
-        elif status & 0x00000002:
-            return 'error'
-        elif status & 0x00000004:
-            return 'pending_deletion'
-        elif status & 0x00000008:
-            return 'paper_jam'
-        elif status & 0x00000010:
-            return 'paper_out'
-        elif status & 0x00000020:
-            return 'manual_feed'
-        elif status & 0x00000040:
-            return 'paper_problem'
-        elif status & 0x00000080:
-            return 'offline'
-        elif status & 0x00000200:
-            return 'busy'
-        elif status & 0x00000400:
-            return 'printing'
-        else:
-            return 'unknown'
+        for mask, name in _WIN32_STATUS_TABLE:
+            if status & mask:
+                return name
+        return 'unknown'
 
     # ============== Printer Management Methods ==============
     # These methods allow remote management of printers
@@ -844,6 +1726,7 @@ class PrinterManager:
         elif self.platform == 'win32':
             self._init_win32()
         
+        self.invalidate_printers()
         return self.get_printers()
 
     def add_printer(self, name: str, uri: str, driver: str = 'everywhere',
@@ -867,47 +1750,27 @@ class PrinterManager:
         
         try:
             # Sanitize printer name (CUPS doesn't allow spaces)
-            safe_name = name.replace(' ', '_').replace('/', '_')
+            safe_name = name.translate(_CUPS_NAME_TRANS)
             
             if self.cups_conn:
-                # Use CUPS API directly
-                import cups
-                
-                # For IPP Everywhere (driverless) printers
+                # pycups creates driverless queues too (ppdname
+                # 'everywhere'), so no lpadmin fork is needed here
                 if driver == 'everywhere' or driver == 'driverless':
-                    # Use lpadmin command for driverless printers
-                    cmd = [
-                        'lpadmin',
-                        '-p', safe_name,
-                        '-v', uri,
-                        '-m', 'everywhere',
-                        '-E'  # Enable printer
-                    ]
-                    if description:
-                        cmd.extend(['-D', description])
-                    if location:
-                        cmd.extend(['-L', location])
-                    
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                    
-                    if result.returncode != 0:
-                        return {
-                            'success': False,
-                            'error': f'lpadmin failed: {result.stderr}'
-                        }
+                    ppdname = 'everywhere'
                 else:
-                    # Use specific PPD file
-                    self.cups_conn.addPrinter(
-                        safe_name,
-                        device=uri,
-                        ppdname=driver,
-                        info=description,
-                        location=location
-                    )
-                    self.cups_conn.enablePrinter(safe_name)
-                    self.cups_conn.acceptJobs(safe_name)
+                    ppdname = driver
+                self.cups_conn.addPrinter(
+                    safe_name,
+                    device=uri,
+                    ppdname=ppdname,
+                    info=description,
+                    location=location
+                )
+                self.cups_conn.enablePrinter(safe_name)
+                self.cups_conn.acceptJobs(safe_name)
                 
                 logger.info(f"Added printer '{safe_name}' with URI '{uri}'")
+                self.invalidate_printers()
                 return {
                     'success': True,
                     'printer_name': safe_name,
@@ -928,6 +1791,7 @@ class PrinterManager:
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
                 
                 if result.returncode == 0:
+                    self.invalidate_printers()
                     return {
                         'success': True,
                         'printer_name': safe_name,
@@ -949,14 +1813,18 @@ class PrinterManager:
     def remove_printer(self, printer_name: str) -> Dict:
         """Remove a printer from the system"""
         if self.platform.startswith('linux'):
-            return self._remove_printer_cups(printer_name)
+            result = self._remove_printer_cups(printer_name)
         elif self.platform == 'win32':
-            return self._remove_printer_win32(printer_name)
+            result = self._remove_printer_win32(printer_name)
         else:
             return {
                 'success': False,
                 'error': f'Unsupported platform: {self.platform}'
             }
+        
+        if result.get('success'):
+            self.invalidate_printers()
+        return result
 
     def _remove_printer_cups(self, printer_name: str) -> Dict:
         """Remove a printer from CUPS"""
@@ -1029,6 +1897,7 @@ class PrinterManager:
                     capture_output=True, text=True, timeout=30
                 )
             
+            self._default_printer = printer_name
             logger.info(f"Set default printer: {printer_name}")
             return {
                 'success': True,
@@ -1088,34 +1957,38 @@ class PrinterManager:
     def print_test_page(self, printer_name: str) -> Dict:
         """Print a test page to the specified printer"""
         try:
-            # Create a simple test page
-            test_content = f"""
-╔══════════════════════════════════════════════════════════════╗
-║               AITS PRINT SERVER - TEST PAGE                  ║
-╠══════════════════════════════════════════════════════════════╣
-║                                                              ║
-║  Printer: {printer_name:<48} ║
-║  Server:  AITS Print Server                                  ║
-║  Date:    {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S'):<48} ║
-║                                                              ║
-║  If you can read this, the printer is working correctly!     ║
-║                                                              ║
-╠══════════════════════════════════════════════════════════════╣
-║             https://www.actief-it.be                         ║
-╚══════════════════════════════════════════════════════════════╝
-"""
+            fields = {
+                'printer': printer_name,
+                'date': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            }
             
             if self.platform.startswith('linux'):
-                # Use lp command
-                process = subprocess.Popen(
+                # Only the variable block needs formatting and a UTF-8
+                # pass; the frame bytes are module constants
+                raw = b''.join((_TP_HEADER,
+                                _TP_MIDDLE_TMPL.format_map(fields).encode('utf-8'),
+                                _TP_FOOTER))
+                
+                # Submit over the live CUPS connection when the library
+                # binds the incremental APIs; no fork at all
+                if self.cups_conn and self._cups_can_stream():
+                    try:
+                        self._print_cups_data(printer_name, raw, 'Test Page',
+                                              'txt', 1, None)
+                        logger.info(f"Test page sent to {printer_name}")
+                        return {
+                            'success': True,
+                            'message': f'Test page sent to {printer_name}'
+                        }
+                    except Exception as e:
+                        logger.debug(f"CUPS test-page submission failed ({e}), trying lp")
+                
+                result = subprocess.run(
                     ['lp', '-d', printer_name],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
+                    input=raw, capture_output=True, timeout=30
                 )
-                stdout, stderr = process.communicate(input=test_content.encode(), timeout=30)
                 
-                if process.returncode == 0:
+                if result.returncode == 0:
                     logger.info(f"Test page sent to {printer_name}")
                     return {
                         'success': True,
@@ -1124,17 +1997,32 @@ class PrinterManager:
                 else:
                     return {
                         'success': False,
-                        'error': f'Failed to print test page: {stderr.decode()}'
+                        'error': f'Failed to print test page: {result.stderr.decode()}'
                     }
             elif self.platform == 'win32':
-                # Create temp file and print
-                import tempfile
+                test_content = _TEST_PAGE_TMPL.format_map(fields)
+                
+                # Write the page straight to the spooler as RAW text: no
+                # temp file, no Notepad launch via ShellExecute. The
+                # spooler accepts a RAW job for any driver, so gate on
+                # the driver actually rendering plain text - otherwise a
+                # host-based/GDI queue reports success and prints nothing
+                if self._win32_supports_raw(printer_name, 'text'):
+                    raw = test_content.encode('cp437', errors='replace')
+                    if self._print_win32_raw_bytes(printer_name, raw, 'Test Page', 1):
+                        logger.info(f"Test page sent to {printer_name}")
+                        return {
+                            'success': True,
+                            'message': f'Test page sent to {printer_name}'
+                        }
+
+                # Driver wants rendered input; fall back to the default
+                # .txt handler
                 with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
                     f.write(test_content)
                     temp_path = f.name
                 
                 try:
-                    import win32api
                     win32api.ShellExecute(0, "print", temp_path, f'/d:"{printer_name}"', ".", 0)
                     logger.info(f"Test page sent to {printer_name}")
                     return {
@@ -1143,16 +2031,7 @@ class PrinterManager:
                     }
                 finally:
                     # Schedule cleanup
-                    import threading
-                    def cleanup():
-                        import time
-                        time.sleep(30)
-                        try:
-                            import os
-                            os.unlink(temp_path)
-                        except:
-                            pass
-                    threading.Thread(target=cleanup, daemon=True).start()
+                    self._cleanup_file_later(temp_path, delay=30)
             else:
                 return {
                     'success': False,
@@ -1174,21 +2053,29 @@ class PrinterManager:
             }
         
         try:
-            # Check if CUPS service is running
-            result = subprocess.run(
-                ['systemctl', 'is-active', 'cups'],
-                capture_output=True, text=True, timeout=10
-            )
-            cups_active = result.stdout.strip() == 'active'
+            # Check if CUPS service is running - an answering cupsd (or
+            # at least its domain socket) instead of forking systemctl
+            if self.cups_conn:
+                try:
+                    self._cups_call('getPrinters')
+                    cups_active = True
+                except Exception:
+                    cups_active = os.path.exists('/run/cups/cups.sock')
+            else:
+                cups_active = os.path.exists('/run/cups/cups.sock')
             
-            # Get CUPS version
-            version_result = subprocess.run(
-                ['cupsd', '-V'],
-                capture_output=True, text=True, timeout=10
-            )
-            version = version_result.stderr.strip() if version_result.stderr else 'Unknown'
+            # The version cannot change while cupsd runs, so fork
+            # cupsd -V once and cache it
+            if self._cups_version is None:
+                version_result = subprocess.run(
+                    ['cupsd', '-V'],
+                    capture_output=True, text=True, timeout=10
+                )
+                self._cups_version = (version_result.stderr.strip()
+                                      if version_result.stderr else 'Unknown')
+            version = self._cups_version
             
-            # Count printers
+            # Count printers (served from the TTL cache)
             printers = self.get_printers()
             
             return {
@@ -376,11 +376,10 @@ def health_check():
 def list_printers():
     """List all available printers - no auth required for web UI"""
     try:
-        printers = printer_manager.get_printers()
-        return jsonify({
-            'success': True,
-            'printers': printers
-        })
+        # Pre-serialized per cache snapshot; avoids re-encoding the list
+        # on every poll from the web UI
+        return app.response_class(printer_manager.get_printers_wire(),
+                                  mimetype='application/json')
     except Exception as e:
         logger.error(f"Error listing printers: {e}", exc_info=True)
         return jsonify({
@@ -673,7 +672,7 @@ def list_jobs():
         
         return jsonify({
             'success': True,
-            'jobs': jobs,
+            'jobs': [job._asdict() for job in jobs],
             'count': len(jobs)
         })
         
@@ -696,7 +695,7 @@ def get_job(job_id):
         if job:
             return jsonify({
                 'success': True,
-                'job': job
+                'job': job._asdict()
             })
         else:
             return jsonify({
@@ -789,7 +788,7 @@ def get_config():
             'enabled': config.get('odoo', {}).get('enabled', False),
             'url': config.get('odoo', {}).get('url', ''),
             'database': config.get('odoo', {}).get('database', ''),
-            'poll_interval': config.get('odoo', {}).get('poll_interval', 10),
+            'poll_interval': config.get('odoo', {}).get('poll_interval', 10),  # deprecated, unused by the client
             'server_name': config.get('odoo', {}).get('server_name', ''),
             'connected': odoo_connected,
         },
@@ -978,6 +977,8 @@ def save_odoo_config():
         if 'database' in odoo_data:
             current_config['odoo']['database'] = odoo_data['database']
         if 'poll_interval' in odoo_data:
+            # Deprecated: the client long-polls and no longer reads this
+            # key; kept so existing settings UIs can still round-trip it
             current_config['odoo']['poll_interval'] = int(odoo_data['poll_interval'])
         if 'server_name' in odoo_data:
             current_config['odoo']['server_name'] = odoo_data['server_name']